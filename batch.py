@@ -0,0 +1,234 @@
+import argparse
+import json
+import os
+import re
+import threading
+import time
+from src.agents.image_generator import generate_images, RateLimitError
+from src.config.settings import (
+    batch_queue_path, batch_max_concurrency, batch_max_attempts, batch_session, derivative_pipeline
+)
+from src.utils.console import console
+from src.utils.job_queue import JobQueue, PENDING, RUNNING, DONE, FAILED
+
+# Seconds between throughput reports
+REPORT_INTERVAL = 30
+
+# Seconds to wait after a 429 when the API gives no Retry-After
+RATE_LIMIT_BACKOFF = 10
+
+
+def parse_line(line):
+    """Turn one line of the batch file into generate_images arguments
+
+    Lines are either JSON objects ({"prompt": ..., "style": ..., "samples": ...,
+    "size": "WxH", "width": ..., "height": ..., "steps": ..., "seed": ...}) or
+    plain prompts using the same style:/samples:/size:/seed: options as the
+    interactive image generator.
+    """
+    if line.startswith("{"):
+        item = json.loads(line)
+    else:
+        item = {}
+        for key, pattern in (("style", r"st?yle:(\w+)"), ("samples", r"samples:(\d+)"),
+                             ("size", r"size:(\d+x\d+)"), ("seed", r"seed:(\d+)")):
+            match = re.search(pattern, line, re.IGNORECASE)
+            if match:
+                item[key] = match.group(1)
+                line = re.sub(pattern, "", line, flags=re.IGNORECASE)
+        item["prompt"] = " ".join(line.split())
+
+    if not item.get("prompt"):
+        raise ValueError("missing prompt")
+
+    job = {"prompt": item["prompt"]}
+    if item.get("style"):
+        job["style"] = item["style"]
+    if item.get("size"):
+        item["width"], item["height"] = str(item["size"]).lower().split("x")
+    for key, maximum in (("samples", 4), ("width", 1024), ("height", 1024), ("steps", 150), ("seed", None)):
+        if item.get(key) is not None:
+            job[key] = int(item[key]) if maximum is None else min(int(item[key]), maximum)
+    return job
+
+
+def read_batch_file(path):
+    jobs = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                jobs.append(parse_line(line))
+            except ValueError as e:
+                console.print(f"[yellow]Skipping line {number}: {e}[/yellow]")
+    return jobs
+
+
+class AdaptiveLimit:
+    """Concurrency limit that halves on rate limiting and grows back one step at a time
+
+    Requests in flight together tend to be rate limited together, so the
+    limit is halved at most once per Retry-After window.
+    """
+
+    def __init__(self, maximum, increase_after=5):
+        self.maximum = maximum
+        self.limit = maximum
+        self.increase_after = increase_after
+        self.in_flight = 0
+        self._successes = 0
+        self._cut_until = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def succeeded(self):
+        with self._condition:
+            self._successes += 1
+            if self._successes >= self.increase_after and self.limit < self.maximum:
+                self.limit += 1
+                self._successes = 0
+                self._condition.notify_all()
+
+    def rate_limited(self, retry_after=None):
+        """Halve the limit, unless it was already halved for this rate limiting window"""
+        now = time.monotonic()
+        with self._condition:
+            self._successes = 0
+            if now < self._cut_until:
+                return
+            self.limit = max(1, self.limit // 2)
+            self._cut_until = now + (retry_after or RATE_LIMIT_BACKOFF)
+
+
+class BatchRunner:
+    """Works through a batch of the job queue with a bounded, adaptive number of requests in flight"""
+
+    def __init__(self, queue, batch, max_concurrency=4, max_attempts=3):
+        self.queue = queue
+        self.batch = batch
+        self.max_attempts = max_attempts
+        self.limit = AdaptiveLimit(max_concurrency)
+        self.completed = 0
+        self.images = 0
+        self.rate_limited = 0
+        self.started = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def run(self):
+        self.started = time.monotonic()
+        workers = [threading.Thread(target=self._work, daemon=True) for _ in range(self.limit.maximum)]
+        reporter = threading.Thread(target=self._report_periodically, daemon=True)
+        for worker in workers:
+            worker.start()
+        reporter.start()
+        try:
+            for worker in workers:
+                while worker.is_alive():
+                    worker.join(timeout=0.5)
+        finally:
+            self._stopped.set()
+        self.report()
+
+    def _work(self):
+        while not self._stopped.is_set():
+            self.limit.acquire()
+            try:
+                job = self.queue.claim(self.batch)
+                if job is None:
+                    if self.queue.counts(self.batch)[PENDING] == 0:
+                        return
+                    # Remaining jobs are waiting out a backoff
+                    time.sleep(0.5)
+                    continue
+                self._process(job)
+            finally:
+                self.limit.release()
+
+    def _process(self, job):
+        try:
+            metadata = generate_images(**job["payload"], session=batch_session)
+        except RateLimitError as e:
+            self.limit.rate_limited(e.retry_after)
+            with self._lock:
+                self.rate_limited += 1
+            console.print(f"[yellow]Rate limited, concurrency lowered to {self.limit.limit}[/yellow]")
+            self.queue.fail(job["id"], str(e), retry_in=e.retry_after or RATE_LIMIT_BACKOFF, count_attempt=False)
+            return
+        except Exception as e:
+            if job["attempts"] < self.max_attempts:
+                self.queue.fail(job["id"], str(e), retry_in=2 ** job["attempts"])
+            else:
+                console.print(f"[red]Giving up on '{job['payload']['prompt'][:60]}': {e}[/red]")
+                self.queue.fail(job["id"], str(e))
+            return
+
+        self.queue.complete(job["id"], {
+            "names": [record["name"] for record in metadata["images"]],
+            "paths": metadata["paths"],
+            "cached": metadata["cached"],
+        })
+        self.limit.succeeded()
+        with self._lock:
+            self.completed += 1
+            self.images += len(metadata["images"])
+
+    def _report_periodically(self):
+        while not self._stopped.wait(REPORT_INTERVAL):
+            self.report()
+
+    def report(self):
+        counts = self.queue.counts(self.batch)
+        total = sum(counts.values())
+        minutes = max(time.monotonic() - self.started, 1e-6) / 60
+        console.print(
+            f"[blue]{counts[DONE]}/{total} done, {counts[FAILED]} failed, {counts[PENDING] + counts[RUNNING]} left"
+            f" | {self.completed / minutes:.1f} prompts/min, {self.images / minutes:.1f} images/min"
+            f" | concurrency {self.limit.limit}/{self.limit.maximum}, {self.rate_limited} rate limited[/blue]"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate images for every prompt in a file")
+    parser.add_argument("file", help="prompts, one per line (plain text or JSON objects)")
+    parser.add_argument("--batch", help="queue name, defaults to the file name; rerun to resume")
+    parser.add_argument("--concurrency", type=int, default=batch_max_concurrency,
+                        help=f"maximum requests in flight (default {batch_max_concurrency})")
+    parser.add_argument("--retry-failed", action="store_true", help="retry jobs that failed in an earlier run")
+    args = parser.parse_args()
+
+    batch = args.batch or os.path.basename(args.file)
+    queue = JobQueue(batch_queue_path)
+
+    added = queue.enqueue(batch, read_batch_file(args.file))
+    resumed = queue.requeue_interrupted(batch)
+    retried = queue.retry_failed(batch) if args.retry_failed else 0
+    counts = queue.counts(batch)
+    console.print(
+        f"[bold blue]Batch '{batch}':[/bold blue] {added} new, {counts[DONE]} already done,"
+        f" {resumed} resumed, {retried} retried, {counts[PENDING]} to run"
+    )
+
+    runner = BatchRunner(queue, batch, max_concurrency=max(1, args.concurrency), max_attempts=batch_max_attempts)
+    try:
+        runner.run()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped; run the same command again to resume.[/yellow]")
+    finally:
+        derivative_pipeline.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import re
+from src.config.storage import image_store_path, image_metadata_path
+from src.utils.console import console
+from src.utils.image_store import ImageStore
+from src.utils.image_metadata import ImageMetadataIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List and search generated images")
+    parser.add_argument("query", nargs="*", help="words that must appear in the prompt")
+    parser.add_argument("--style", help="only images generated with this style")
+    parser.add_argument("--size", help="only images of this size, e.g. 512x512")
+    parser.add_argument("--since", help="only images generated on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--until", help="only images generated on or before this date (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=20, help="maximum number of results (default 20)")
+    args = parser.parse_args()
+
+    width = height = None
+    if args.size:
+        size_match = re.fullmatch(r"(\d+)x(\d+)", args.size)
+        if not size_match:
+            parser.error("--size must look like WIDTHxHEIGHT")
+        width, height = int(size_match.group(1)), int(size_match.group(2))
+
+    # Opened directly; the full settings would create API clients this tool never uses
+    image_store = ImageStore(image_store_path)
+    image_metadata_index = ImageMetadataIndex(image_metadata_path)
+
+    results = image_metadata_index.search(
+        " ".join(args.query) or None,
+        style=args.style,
+        width=width,
+        height=height,
+        since=args.since,
+        until=args.until,
+        limit=args.limit,
+    )
+
+    if not results:
+        console.print("[yellow]No matching images.[/yellow]")
+        return
+
+    for result in results:
+        record = image_store.get(result["seq"])
+        console.print(f"\n[bold cyan]{result['name']}[/bold cyan] [dim]{result['created_at'][:19]}[/dim]")
+        details = [f"{result['width']}x{result['height']}"]
+        if result["style"]:
+            details.append(result["style"])
+        if result["seed"]:
+            details.append(f"seed {result['seed']}")
+        console.print(f"[dim]{', '.join(details)}[/dim]")
+        console.print(result["prompt"], markup=False)
+        if record:
+            console.print(f"Saved to: {record['path']}", markup=False)
+
+
+if __name__ == "__main__":
+    main()
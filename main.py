@@ -1,63 +1,34 @@
-from langgraph.graph import Graph
-from src.core.workflow import create_research_workflow, create_image_workflow, create_translation_workflow, create_grammar_workflow
+from src.core.workflow import (
+    create_research_workflow, create_image_workflow, create_summary_workflow,
+    create_code_explanation_workflow, create_translation_workflow, create_grammar_workflow
+)
 from src.core.state import AgentState
 from src.utils.console import console, clear_screen
-from src.utils.display import print_chat_history
-from src.agents.summarizer import create_summarizer_agent
-from src.agents.code_explainer import create_code_explainer_agent
+from src.utils.display import run_workflow
+from src.utils.history import ConversationHistory
+from src.config.settings import history_token_budget, history_summary_tokens, derivative_pipeline
+import asyncio
 import re
 
-def create_summary_workflow():
-    """Create a workflow for text summarization"""
-    workflow = Graph()
-    
-    # Create the summarizer function
-    summarizer = create_summarizer_agent()
-    
-    # Add nodes to the graph
-    workflow.add_node("summarizer", summarizer)
-    workflow.add_node("output", lambda state: dict(state))
-    
-    # Set up the workflow
-    workflow.set_entry_point("summarizer")
-    workflow.add_edge("summarizer", "output")
-    workflow.set_finish_point("output")
-    
-    # Return the compiled workflow
-    return workflow.compile()
-
-def create_code_explanation_workflow():
-    """Create a workflow for code explanation"""
-    workflow = Graph()
-    
-    # Create the code explainer function
-    code_explainer = create_code_explainer_agent()
-    
-    # Add nodes to the graph
-    workflow.add_node("code_explainer", code_explainer)
-    workflow.add_node("output", lambda state: dict(state))
-    
-    # Set up the workflow
-    workflow.set_entry_point("code_explainer")
-    workflow.add_edge("code_explainer", "output")
-    workflow.set_finish_point("output")
-    
-    # Return the compiled workflow
-    return workflow.compile()
-
 def main():
-    # Create workflows
-    research_chain = create_research_workflow()
-    image_chain = create_image_workflow()
-    summary_chain = create_summary_workflow()
-    code_chain = create_code_explanation_workflow()
-    translation_chain = create_translation_workflow()
-    grammar_chain = create_grammar_workflow()
+    # Create workflows, compiled for ainvoke
+    research_chain = create_research_workflow(use_async=True)
+    image_chain = create_image_workflow(use_async=True)
+    summary_chain = create_summary_workflow(use_async=True)
+    code_chain = create_code_explanation_workflow(use_async=True)
+    translation_chain = create_translation_workflow(use_async=True)
+    grammar_chain = create_grammar_workflow(use_async=True)
     
-    # Initialize empty chat history
-    chat_history = []
+    # One event loop for the whole session so the async client can reuse its connections
+    loop = asyncio.new_event_loop()
+    
+    # Initialize empty chat history, compacted to stay within its token budget
+    chat_history = ConversationHistory(history_token_budget, history_summary_tokens)
     current_workflow = None
     
+    # Last text sent to the summarizer, so a bare 'short'/'long' reuses it
+    last_summary_text = None
+    
     clear_screen()
     console.print("\n[bold blue]=== Welcome to the AI Assistant! ===[/bold blue]")
     
@@ -86,11 +57,12 @@ def main():
                 console.print("""[dim]Tips:
 - Use 'style:TYPE' to specify style (e.g. 'style:Anime')
 - Use 'samples:N' for multiple images (max 4)
-- Use 'size:WxH' for custom dimensions[/dim]""")
+- Use 'size:WxH' for custom dimensions
+- Use 'seed:N' to reproduce an image; repeating a seeded request reuses the stored images[/dim]""")
             elif choice == "3":
                 current_workflow = ("summary", summary_chain)
                 console.print("\n[green]Text Summarizer activated! Paste the text you want to summarize...[/green]")
-                console.print("[dim]Type 'short' or 'long' after summary to see different lengths[/dim]")
+                console.print("[dim]Add 'short' or 'long' after your text, or type it on its own to resummarize the last text[/dim]")
             elif choice == "4":
                 current_workflow = ("code", code_chain)
                 console.print("\n[green]Code Explainer activated! Paste your code...[/green]")
@@ -99,29 +71,33 @@ def main():
                 current_workflow = ("translation", translation_chain)
                 console.print("\n[green]Translator activated![/green]")
                 console.print("""[dim]Format: text to translate | target language
-Example: Hello, how are you? | Spanish[/dim]""")
+Example: Hello, how are you? | Spanish
+Several targets: Hello, how are you? | Spanish, French, German
+Documents: file:notes.txt out:notes_es.txt | Spanish[/dim]""")
             elif choice == "6":
                 current_workflow = ("grammar", grammar_chain)
                 console.print("\n[green]Grammar Checker activated![/green]")
                 console.print("""[dim]Add flags for specific checks:
 --grammar: Grammar only
 --style: Writing style
---tone: Tone analysis[/dim]""")
+--tone: Tone analysis
+--quick: Spelling and punctuation only, checked locally without the LLM[/dim]""")
             else:
                 console.print("\n[red]Invalid choice. Please try again.[/red]")
                 continue
         
+        task = None
         try:
             user_input = input("\nYou: ").strip()
             
             if user_input.lower() in ['quit', 'exit']:
                 current_workflow = None
-                chat_history = []
+                chat_history.clear()
                 clear_screen()
                 continue
             
             if user_input.lower() == 'clear':
-                chat_history = []
+                chat_history.clear()
                 clear_screen()
                 continue
             
@@ -133,8 +109,12 @@ Example: Hello, how are you? | Spanish[/dim]""")
             samples = 1
             width = 512
             height = 512
+            seed = None
             check_type = "all"
             target_lang = None
+            target_langs = None
+            source_file = None
+            output_file = None
             summary_type = None
             
             # Process special commands for image generation
@@ -157,21 +137,49 @@ Example: Hello, how are you? | Spanish[/dim]""")
                     width = min(int(size_match.group(1)), 1024)
                     height = min(int(size_match.group(2)), 1024)
                     user_input = re.sub(r'size:\d+x\d+', '', user_input).strip()
+                
+                # Parse an explicit seed
+                seed_match = re.search(r'seed:(\d+)', user_input)
+                if seed_match:
+                    seed = int(seed_match.group(1))
+                    user_input = re.sub(r'seed:\d+', '', user_input).strip()
             
             # Process special commands for summarizer
             elif current_workflow[0] == "summary":
                 last_word = user_input.split()[-1].lower()
-                if last_word in ['short', 'long']:
+                if last_word in ['short', 'medium', 'long']:
                     summary_type = last_word
                     user_input = ' '.join(user_input.split()[:-1])
+                
+                # A bare length request reuses the previous text
+                if not user_input and last_summary_text:
+                    user_input = last_summary_text
+                elif user_input:
+                    last_summary_text = user_input
             
             # Process translation input
             elif current_workflow[0] == "translation":
+                # Parse document input and output files
+                file_match = re.search(r'file:(\S+)', user_input)
+                if file_match:
+                    source_file = file_match.group(1)
+                    user_input = re.sub(r'file:\S+', '', user_input).strip()
+                
+                out_match = re.search(r'out:(\S+)', user_input)
+                if out_match:
+                    output_file = out_match.group(1)
+                    user_input = re.sub(r'out:\S+', '', user_input).strip()
+                
                 parts = user_input.split("|")
                 if len(parts) > 1:
                     text = parts[0].strip()
-                    target_lang = parts[1].strip()
+                    # Several comma-separated targets are translated in one run
+                    target_langs = [lang.strip() for lang in parts[1].split(",") if lang.strip()]
+                    target_lang = target_langs[0] if target_langs else None
                     user_input = text
+                
+                if source_file and not user_input:
+                    user_input = f"Translate {source_file}"
             
             # Process grammar checker flags
             elif current_workflow[0] == "grammar":
@@ -184,13 +192,19 @@ Example: Hello, how are you? | Spanish[/dim]""")
                 elif "--tone" in user_input:
                     check_type = "tone"
                     user_input = user_input.replace("--tone", "").strip()
+                elif "--quick" in user_input:
+                    check_type = "quick"
+                    user_input = user_input.replace("--quick", "").strip()
             
             # Create initial state with chat history and new message
+            chat_history.append({
+                "role": "user",
+                "content": user_input
+            })
+            messages = chat_history.as_messages()
+            sent_count = len(messages)
             initial_state = AgentState(
-                messages=chat_history + [{
-                    "role": "user",
-                    "content": user_input
-                }],
+                messages=messages,
                 current_task="process",
                 task_status="in_progress",
                 workflow_type=current_workflow[0],
@@ -199,31 +213,40 @@ Example: Hello, how are you? | Spanish[/dim]""")
                 num_samples=samples,
                 image_width=width,
                 image_height=height,
+                seed=seed,
                 target_language=target_lang,
-                check_type=check_type
+                target_languages=target_langs,
+                source_file=source_file,
+                output_file=output_file,
+                check_type=check_type,
+                summary_type=summary_type
             )
             
-            # Run the workflow
+            # Run the workflow, printing only the new exchange as it is produced
             if current_workflow[1] is not None:
-                result = dict(current_workflow[1].invoke(initial_state))
-                
-                # Handle summary type selection after generation
-                if current_workflow[0] == "summary" and "summaries" in result:
-                    if summary_type and summary_type in result["summaries"]:
-                        result["messages"][-1]["content"] = f"Here's the {summary_type} summary:\n\n{result['summaries'][summary_type]}"
+                task = loop.create_task(run_workflow(current_workflow[1], initial_state))
+                result = loop.run_until_complete(task)
                 
-                # Update chat history and display
+                # Keep only the messages added during this turn
                 if result and "messages" in result:
-                    chat_history = result["messages"]
-                    print_chat_history(chat_history, result)
+                    chat_history.extend(result["messages"][sent_count:])
             
         except KeyboardInterrupt:
+            # Cancel the interrupted workflow and let it unwind, so it doesn't resume on the next turn
+            if task is not None and not task.done():
+                task.cancel()
+                loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
             console.print("\n\n[yellow]Returning to workflow selection...[/yellow]")
             current_workflow = None
-            chat_history = []
+            chat_history.clear()
         except Exception as e:
             console.print(f"\n[red]An error occurred: {e}[/red]")
             console.print("Please try again.")
+    
+    loop.close()
+    
+    # Let queued thumbnails and conversions finish before exiting
+    derivative_pipeline.shutdown()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,19 +1,45 @@
 from typing import Dict
 from ..core.state import AgentState
-from ..utils.console import console
-from ..config.settings import co
+from ..utils.console import console, agent_status
+from ..config.settings import co, aco
+
+def analysis_prompt(research_results: str) -> str:
+    return f"""As an analytical agent, analyze this research: {research_results}
+                    Identify patterns, implications, and draw meaningful conclusions."""
 
 def create_analyzer_agent():
     def analyze(state: AgentState) -> AgentState:
         """Analyzer agent that processes research results"""
         
-        with console.status("[bold blue]Analyzing...", spinner="dots") as status:
+        with agent_status("[bold blue]Analyzing...") as status:
             try:
                 response = co.generate(
-                    prompt=f"""As an analytical agent, analyze this research: {state['research_results']}
-                    Identify patterns, implications, and draw meaningful conclusions.""",
+                    prompt=analysis_prompt(state['research_results']),
+                    max_tokens=300,
+                    temperature=0.7,
+                    agent="analyzer",
+                )
+                
+                state["analysis_results"] = response.generations[0].text.strip()
+                
+            except Exception as e:
+                console.print(f"\n[red]Error in analysis: {e}[/red]")
+        
+        return state
+
+    return analyze
+
+def create_analyzer_agent_async():
+    async def analyze(state: AgentState) -> AgentState:
+        """Async analyzer agent that processes research results"""
+        
+        with agent_status("[bold blue]Analyzing...") as status:
+            try:
+                response = await aco.generate(
+                    prompt=analysis_prompt(state['research_results']),
                     max_tokens=300,
                     temperature=0.7,
+                    agent="analyzer",
                 )
                 
                 state["analysis_results"] = response.generations[0].text.strip()
@@ -23,4 +49,4 @@ def create_analyzer_agent():
         
         return state
 
-    return analyze 
\ No newline at end of file
+    return analyze
@@ -1,14 +1,63 @@
 from typing import Dict
+from collections import OrderedDict
 import re
 from ..core.state import AgentState
-from ..utils.console import console
-from ..config.settings import co
+from ..utils.console import console, agent_status
+from ..config.settings import co, llm_max_concurrency, code_explain_timeout
+from ..utils.concurrency import run_concurrently, as_async_node
+from ..utils.python_units import split_python_source, normalized_source_hash
+
+# Number of unit explanations kept in memory
+EXPLANATION_CACHE_SIZE = 256
+
+# Simple hints used to guess the language of a code block
+LANGUAGE_HINTS = {
+    'def ': 'Python',
+    'function ': 'JavaScript',
+    'class ': 'Object-Oriented Code',
+    'import ': 'Python',
+    'console.': 'JavaScript',
+    'print': 'Python',
+    'var ': 'JavaScript',
+    'let ': 'JavaScript',
+    'const ': 'JavaScript'
+}
+
+def detect_language(code_block: str) -> str:
+    """Guess the programming language of a code block"""
+    for hint, lang in LANGUAGE_HINTS.items():
+        if hint in code_block:
+            return lang
+    return 'Code'
 
 def create_code_explainer_agent():
+    # Explanations of functions, classes and blocks, keyed by normalized source hash
+    explanation_cache = OrderedDict()
+
+    def explain_block(code_block):
+        detected_language = detect_language(code_block)
+        
+        response = co.generate(
+            prompt=f"""Analyze this {detected_language} code and provide:
+            1. A high-level overview of what the code does
+            2. Key components and their purposes
+            3. Potential improvements or best practices
+            4. Any security considerations
+            
+            Code:
+            {code_block}
+            """,
+            max_tokens=500,
+            temperature=0.7,
+            agent="code_explainer",
+        )
+        
+        return response.generations[0].text.strip()
+
     def explain_code(state: AgentState) -> AgentState:
         """Code explainer agent that analyzes and explains code snippets"""
         
-        with console.status("[bold blue]Analyzing code...", spinner="dots") as status:
+        with agent_status("[bold blue]Analyzing code...") as status:
             try:
                 # Get the code from the last message
                 code_content = state["messages"][-1]["content"]
@@ -20,43 +69,48 @@ def create_code_explainer_agent():
                     # If no code blocks found, treat the entire content as code
                     code_blocks = [code_content]
                 
+                # Large Python modules are split into top-level functions and classes
+                units = [unit for code_block in code_blocks for unit in split_python_source(code_block)]
+                keys = [normalized_source_hash(code) for _, code in units]
+                
+                # Only explain units that changed since they were last seen
+                pending = {}
+                for key, (_, code) in zip(keys, units):
+                    if key not in explanation_cache and key not in pending:
+                        pending[key] = code
+                
+                # Explain the remaining units concurrently
+                results = run_concurrently(
+                    explain_block,
+                    pending.values(),
+                    max_workers=llm_max_concurrency,
+                    timeout=code_explain_timeout,
+                )
+                
+                errors = {}
+                for key, (explanation, error) in zip(pending, results):
+                    if error is not None:
+                        errors[key] = error
+                    else:
+                        explanation_cache[key] = explanation
+                
+                # Reassemble the explanations in their original order
                 explanations = []
+                for index, (key, (label, _)) in enumerate(zip(keys, units), 1):
+                    name = label or f"code block {index}"
+                    if key in errors:
+                        console.print(f"\n[yellow]Warning: {name} failed: {errors[key]}[/yellow]")
+                        explanations.append(f"(Could not explain {name}: {errors[key]})")
+                        continue
+                    explanation_cache.move_to_end(key)
+                    explanation = explanation_cache[key]
+                    explanations.append(f"**{label}**\n{explanation}" if label else explanation)
+                
+                while len(explanation_cache) > EXPLANATION_CACHE_SIZE:
+                    explanation_cache.popitem(last=False)
                 
-                for code_block in code_blocks:
-                    # Detect programming language
-                    language_hints = {
-                        'def ': 'Python',
-                        'function ': 'JavaScript',
-                        'class ': 'Object-Oriented Code',
-                        'import ': 'Python',
-                        'console.': 'JavaScript',
-                        'print': 'Python',
-                        'var ': 'JavaScript',
-                        'let ': 'JavaScript',
-                        'const ': 'JavaScript'
-                    }
-                    
-                    detected_language = 'Code'
-                    for hint, lang in language_hints.items():
-                        if hint in code_block:
-                            detected_language = lang
-                            break
-                    
-                    response = co.generate(
-                        prompt=f"""Analyze this {detected_language} code and provide:
-                        1. A high-level overview of what the code does
-                        2. Key components and their purposes
-                        3. Potential improvements or best practices
-                        4. Any security considerations
-                        
-                        Code:
-                        {code_block}
-                        """,
-                        max_tokens=500,
-                        temperature=0.7,
-                    )
-                    
-                    explanations.append(response.generations[0].text.strip())
+                if len(errors) == len(set(keys)):
+                    raise Exception(next(iter(errors.values())))
                 
                 # Combine all explanations
                 final_explanation = "\n\n".join(explanations)
@@ -76,4 +130,8 @@ def create_code_explainer_agent():
         
         return state
 
-    return explain_code 
\ No newline at end of file
+    return explain_code
+
+def create_code_explainer_agent_async():
+    """Async code explainer node"""
+    return as_async_node(create_code_explainer_agent())
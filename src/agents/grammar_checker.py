@@ -1,47 +1,162 @@
 from typing import Dict
+from collections import OrderedDict
+import hashlib
+import itertools
 import re
 from ..core.state import AgentState
-from ..utils.console import console
-from ..config.settings import co
+from ..utils.console import console, agent_status
+from ..config.settings import co, llm_max_concurrency, stream_responses
+from ..utils.concurrency import run_concurrently, as_async_node
+from ..utils.text import split_paragraphs
+from ..utils.grammar_rules import apply_rules, format_issues
+from ..utils.display import stream_to_console
+
+# Number of paragraph analyses kept in memory
+ANALYSIS_CACHE_SIZE = 512
+
+# Check type that only runs the local rules, without calling the LLM
+QUICK_CHECK = "quick"
+
+ANALYSIS_PROMPTS = {
+    "grammar": "Check for grammatical errors and provide corrections.",
+    "style": "Analyze writing style and suggest improvements for clarity and impact.",
+    "tone": "Evaluate the tone and suggest adjustments for the intended audience.",
+    "all": "Provide a comprehensive analysis of grammar, style, and tone."
+}
 
 def create_grammar_checker_agent():
+    # Paragraph analyses, keyed by check type and a hash of the paragraph
+    analysis_cache = OrderedDict()
+
+    def check_paragraph(paragraph, check_type, status=None):
+        """Run the local rules, then ask the LLM about the paragraph
+
+        The rules only catch mechanical slips (spelling, spacing, capitals), so
+        they settle a paragraph on their own only in the quick check. Otherwise
+        the LLM sees the original paragraph along with their findings. When a
+        status spinner is passed the result is streamed to the console.
+        """
+        corrected, fixes, flags = apply_rules(paragraph)
+        issues = format_issues(fixes, flags)
+        
+        if check_type == QUICK_CHECK:
+            if not issues:
+                return "The automatic checks found no spelling or punctuation issues."
+            return f"Automatic checks:\n{issues}\n\nCorrected text:\n{corrected}"
+        
+        prefix = f"Automatic checks:\n{issues}\n\n" if issues else ""
+        if status is not None:
+            chunks = co.generate_stream(
+                prompt=analysis_prompt(paragraph, check_type, issues),
+                max_tokens=500,
+                temperature=0.7,
+                agent="grammar_checker",
+            )
+            return stream_to_console(itertools.chain([prefix], chunks), title="Final Response", status=status)
+        
+        return prefix + analyze_paragraph(paragraph, check_type, issues)
+
+    def analysis_prompt(paragraph, check_type, issues=""):
+        findings = f"""
+        
+        Automatic checks already found these mechanical issues, include them in your corrections:
+        {issues}""" if issues else ""
+        return f"""Analyze this text and {ANALYSIS_PROMPTS.get(check_type, ANALYSIS_PROMPTS['all'])}
+
+        Text: {paragraph}{findings}
+        
+        Provide:
+        1. Identified issues
+        2. Suggested corrections
+        3. Overall improvement recommendations
+        4. Revised version of the text"""
+
+    def analyze_paragraph(paragraph, check_type, issues=""):
+        response = co.generate(
+            prompt=analysis_prompt(paragraph, check_type, issues),
+            max_tokens=500,
+            temperature=0.7,
+            agent="grammar_checker",
+        )
+        
+        return response.generations[0].text.strip()
+
     def check_grammar(state: AgentState) -> AgentState:
         """Grammar checker agent that analyzes and improves text"""
         
-        with console.status("[bold blue]Checking grammar and style...", spinner="dots") as status:
+        with agent_status("[bold blue]Checking grammar and style...") as status:
             try:
                 text = state["messages"][-1]["content"]
                 check_type = state.get("check_type", "all")
                 
-                analysis_prompts = {
-                    "grammar": "Check for grammatical errors and provide corrections.",
-                    "style": "Analyze writing style and suggest improvements for clarity and impact.",
-                    "tone": "Evaluate the tone and suggest adjustments for the intended audience.",
-                    "all": "Provide a comprehensive analysis of grammar, style, and tone."
-                }
+                # Analyze paragraph by paragraph so unchanged ones can be reused
+                paragraphs = split_paragraphs(text) or [text]
+                keys = [
+                    (check_type, hashlib.sha256(paragraph.encode("utf-8")).hexdigest())
+                    for paragraph in paragraphs
+                ]
                 
-                prompt = f"""Analyze this text and {analysis_prompts.get(check_type, analysis_prompts['all'])}
-
-                Text: {text}
+                pending = {}
+                for key, paragraph in zip(keys, paragraphs):
+                    if key not in analysis_cache and key not in pending:
+                        pending[key] = paragraph
+                
+                if stream_responses and len(paragraphs) == 1 and pending and check_type != QUICK_CHECK:
+                    # A single paragraph is streamed straight to the console
+                    try:
+                        results = [(check_paragraph(paragraphs[0], check_type, status=status), None)]
+                        state["response_streamed"] = True
+                    except Exception as e:
+                        results = [(None, e)]
+                elif check_type == QUICK_CHECK:
+                    # The local rules take microseconds, no thread pool needed
+                    results = [(check_paragraph(paragraph, check_type), None) for paragraph in pending.values()]
+                else:
+                    # Check only the changed paragraphs, in parallel
+                    results = run_concurrently(
+                        lambda paragraph: check_paragraph(paragraph, check_type),
+                        pending.values(),
+                        max_workers=llm_max_concurrency,
+                    )
+                
+                errors = {}
+                for key, (analysis, error) in zip(pending, results):
+                    if error is not None:
+                        errors[key] = error
+                    else:
+                        analysis_cache[key] = analysis
                 
-                Provide:
-                1. Identified issues
-                2. Suggested corrections
-                3. Overall improvement recommendations
-                4. Revised version of the text"""
+                if errors and len(errors) == len(set(keys)):
+                    raise Exception(next(iter(errors.values())))
                 
-                response = co.generate(
-                    prompt=prompt,
-                    max_tokens=500,
-                    temperature=0.7,
-                )
+                # Merge the paragraph analyses in their original order
+                paragraph_results = []
+                sections = []
+                for index, (key, paragraph) in enumerate(zip(keys, paragraphs), 1):
+                    if key in errors:
+                        console.print(f"\n[yellow]Warning: paragraph {index} failed: {errors[key]}[/yellow]")
+                        analysis = f"(Could not check this paragraph: {errors[key]})"
+                    else:
+                        analysis_cache.move_to_end(key)
+                        analysis = analysis_cache[key]
+                    
+                    paragraph_results.append({
+                        "text": paragraph,
+                        "analysis": analysis,
+                        "cached": key not in pending
+                    })
+                    sections.append(f"**Paragraph {index}**\n{analysis}" if len(paragraphs) > 1 else analysis)
                 
-                analysis = response.generations[0].text.strip()
+                while len(analysis_cache) > ANALYSIS_CACHE_SIZE:
+                    analysis_cache.popitem(last=False)
+                
+                analysis = "\n\n".join(sections)
                 
                 state["grammar_analysis"] = {
                     "original_text": text,
                     "analysis": analysis,
-                    "check_type": check_type
+                    "check_type": check_type,
+                    "paragraphs": paragraph_results
                 }
                 
                 state["messages"].append({
@@ -58,4 +173,8 @@ def create_grammar_checker_agent():
         
         return state
 
-    return check_grammar 
\ No newline at end of file
+    return check_grammar
+
+def create_grammar_checker_agent_async():
+    """Async grammar checker node"""
+    return as_async_node(create_grammar_checker_agent())
@@ -1,100 +1,214 @@
 import requests
-import os
 import base64
 from typing import Dict
 from ..core.state import AgentState
-from ..utils.console import console
-from ..config.settings import stability_api_key
-from PIL import Image
-from io import BytesIO
+from ..utils.console import console, agent_status
+from ..config.settings import (
+    stability_api_key, stability_session, stability_connect_timeout, stability_read_timeout,
+    stability_binary_download, image_store, image_cache_enabled, derivative_pipeline,
+    image_metadata_index
+)
 from datetime import datetime
+from ..utils.concurrency import as_async_node, run_concurrently
+
+# Base64 characters decoded at a time; a multiple of 4 so each block decodes on its own
+DECODE_BLOCK_CHARS = 64 * 1024
+
+def decode_base64_blocks(data):
+    """Decode a base64 image one block at a time"""
+    for start in range(0, len(data), DECODE_BLOCK_CHARS):
+        yield base64.b64decode(data[start:start + DECODE_BLOCK_CHARS])
+
+# Bytes written at a time when streaming a binary image response
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+class RateLimitError(Exception):
+    """The Stability API answered 429 and the session gave up retrying (or never retries 429s)"""
+
+    def __init__(self, retry_after=None):
+        super().__init__("Stability API rate limit reached")
+        self.retry_after = float(retry_after) if retry_after and retry_after.isdigit() else None
+
+def seed_value(seed):
+    """The seed the API used for an image, or None if it didn't say"""
+    try:
+        return int(seed) or None
+    except (TypeError, ValueError):
+        return None
+
+def request_cache_key(url, body):
+    """Everything that determines the images returned for a request"""
+    return {"url": url, **body}
+
+def request_images(url, body, session=None):
+    """Call the Stability API and save the returned images to the image store"""
+    # The API only returns raw bytes for a single image
+    binary = stability_binary_download and body["samples"] == 1
+    
+    headers = {
+        "Authorization": f"Bearer {stability_api_key}",
+        "Content-Type": "application/json",
+        "Accept": "image/png" if binary else "application/json"
+    }
+    
+    response = (session or stability_session).post(
+        url,
+        headers=headers,
+        json=body,
+        timeout=(stability_connect_timeout, stability_read_timeout),
+        stream=binary,
+    )
+    
+    # Closing the response hands a streamed connection back to the pool, errors included
+    with response:
+        if response.status_code == 429:
+            raise RateLimitError(response.headers.get("Retry-After"))
+        
+        if response.status_code != 200:
+            error_msg = response.json().get('message', f"API returned status code: {response.status_code}")
+            raise Exception(error_msg)
+        
+        if binary:
+            # Stream the PNG straight into the image store instead of decoding base64 JSON
+            return [{
+                **image_store.save(response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES)),
+                "seed": seed_value(response.headers.get("seed")),
+            }]
+        
+        # Every requested sample comes back as its own artifact
+        artifacts = response.json()["artifacts"]
+    
+    # Decode and save the images in parallel
+    results = run_concurrently(
+        lambda artifact: {
+            **image_store.save(decode_base64_blocks(artifact["base64"])),
+            "seed": seed_value(artifact.get("seed")),
+        },
+        artifacts,
+        max_workers=max(1, min(len(artifacts), 4)),
+    )
+    
+    records = []
+    for record, error in results:
+        if error is not None:
+            console.print(f"\n[yellow]Warning: could not save an image: {error}[/yellow]")
+        else:
+            records.append(record)
+    
+    if not records:
+        raise Exception("No images were returned")
+    
+    return records
+
+# Style modifiers added to the prompt for each style preference
+STYLE_MODIFIERS = {
+    "Photorealistic": ", photorealistic, highly detailed, 8k resolution",
+    "Digital Art": ", digital art, clean lines, vibrant colors",
+    "Oil Painting": ", oil painting, textured, artistic, masterpiece",
+    "Watercolor": ", watercolor painting, soft edges, flowing colors",
+    "Anime/Manga": ", anime style, manga art, cel shaded",
+    "3D Rendered": ", 3D rendered, octane render, realistic lighting",
+    "Sketch": ", pencil sketch, hand-drawn, detailed linework"
+}
+
+def generate_images(prompt, style=None, samples=1, width=512, height=512, steps=30, seed=None,
+                    session=None):
+    """Generate and store images for a prompt, returning their metadata
+
+    Used by the image generator agent and by the batch runner. Errors are
+    raised; RateLimitError signals that the API is still throttling after
+    the session's own retries. session defaults to the shared Stability
+    session.
+    """
+    # Add quality and detail modifiers
+    prompt += ", high quality, detailed, masterpiece, best quality"
+    
+    # Add style modifier if present
+    prompt += STYLE_MODIFIERS.get(style, "")
+
+    # Validate prompt length
+    if len(prompt) > 1000:
+        prompt = prompt[:997] + "..."
+
+    body = {
+        "text_prompts": [{"text": prompt}],
+        "cfg_scale": 7,
+        "height": height,
+        "width": width,
+        # Limit to 4 images max
+        "samples": min(samples, 4),
+        "steps": steps,
+        # 0 lets the API pick a random seed
+        "seed": seed or 0,
+    }
+    
+    # Using Stability AI API
+    url = "https://api.stability.ai/v1/generation/stable-diffusion-v1-6/text-to-image"
+    
+    # Identical requests with an explicit seed are answered with the images they produced before;
+    # without one the user expects a new random image every time
+    records = None
+    if image_cache_enabled and body["seed"]:
+        records = image_store.cached_generation(request_cache_key(url, body))
+    cached = records is not None
+    if not cached:
+        records = request_images(url, body, session)
+        # Thumbnails and conversions are made in the background; report where the
+        # image will end up if the original PNG is going to be dropped
+        derivative_pipeline.submit(records)
+        records = [derivative_pipeline.final_record(record) for record in records]
+        
+        # A random single image is remembered under the seed the API picked,
+        # so asking for that seed later reuses it
+        cache_seed = body["seed"] or (records[0]["seed"] if len(records) == 1 else None)
+        if image_cache_enabled and cache_seed:
+            image_store.remember_generation(request_cache_key(url, {**body, "seed": cache_seed}), records)
+    
+    metadata = {
+        "prompt": prompt,
+        "settings": body,
+        "style": style,
+        "paths": [record["path"] for record in records],
+        "images": records,
+        "cached": cached,
+        "timestamp": datetime.now().isoformat()
+    }
+    if not cached:
+        image_metadata_index.add(metadata)
+    
+    return metadata
 
 def create_image_generator_agent():
     def generate_image(state: AgentState) -> AgentState:
         """Generate image using Stability AI with enhanced features"""
         
-        enhanced_prompt = state["enhanced_prompt"]
-        
-        with console.status("[bold green]Generating image...", spinner="dots") as status:
+        with agent_status("[bold green]Generating image...") as status:
             try:
-                # Add style modifiers based on preferences
-                style_modifiers = {
-                    "Photorealistic": ", photorealistic, highly detailed, 8k resolution",
-                    "Digital Art": ", digital art, clean lines, vibrant colors",
-                    "Oil Painting": ", oil painting, textured, artistic, masterpiece",
-                    "Watercolor": ", watercolor painting, soft edges, flowing colors",
-                    "Anime/Manga": ", anime style, manga art, cel shaded",
-                    "3D Rendered": ", 3D rendered, octane render, realistic lighting",
-                    "Sketch": ", pencil sketch, hand-drawn, detailed linework"
-                }
-
-                # Add quality and detail modifiers
-                enhanced_prompt += ", high quality, detailed, masterpiece, best quality"
-                
-                # Add style modifier if present in state
-                if "style_preference" in state:
-                    enhanced_prompt += style_modifiers.get(state["style_preference"], "")
-
-                # Validate prompt length
-                if len(enhanced_prompt) > 1000:
-                    enhanced_prompt = enhanced_prompt[:997] + "..."
-
-                # Allow for multiple image variations
-                num_samples = state.get("num_samples", 1)
-                if num_samples > 4:  # Limit to 4 images max
-                    num_samples = 4
-
-                body = {
-                    "text_prompts": [{"text": enhanced_prompt}],
-                    "cfg_scale": 7,
-                    "height": state.get("image_height", 512),
-                    "width": state.get("image_width", 512),
-                    "samples": num_samples,
-                    "steps": state.get("steps", 30),
-                }
-                
-                # Using Stability AI API
-                url = "https://api.stability.ai/v1/generation/stable-diffusion-v1-6/text-to-image"
-                
-                headers = {
-                    "Authorization": f"Bearer {stability_api_key}",
-                    "Content-Type": "application/json",
-                    "Accept": "application/json"
-                }
+                metadata = generate_images(
+                    state["enhanced_prompt"],
+                    style=state.get("style_preference"),
+                    samples=state.get("num_samples", 1),
+                    width=state.get("image_width", 512),
+                    height=state.get("image_height", 512),
+                    steps=state.get("steps", 30),
+                    seed=state.get("seed"),
+                )
                 
-                response = requests.post(url, headers=headers, json=body)
-                
-                if response.status_code == 200:
-                    # Create images directory if it doesn't exist
-                    if not os.path.exists("generated_images"):
-                        os.makedirs("generated_images")
-                    
-                    # Get the base64 image data and decode it
-                    image_data = response.json()["artifacts"][0]["base64"]
-                    image_bytes = base64.b64decode(image_data)
-                    
-                    # Generate unique filename
-                    image_path = f"generated_images/image_{len(os.listdir('generated_images')) + 1}.png"
-                    
-                    # Save the image using binary write mode
-                    with open(image_path, "wb") as f:
-                        f.write(image_bytes)
-                    
-                    state["image_path"] = image_path
-                    state["messages"].append({
-                        "role": "assistant",
-                        "content": f"Image generated and saved as: {image_path}\nPrompt used: {enhanced_prompt}"
-                    })
-
-                    # Add image metadata
-                    state["image_metadata"] = {
-                        "prompt": enhanced_prompt,
-                        "settings": body,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    error_msg = response.json().get('message', f"API returned status code: {response.status_code}")
-                    raise Exception(error_msg)
+                records = metadata["images"]
+                state["image_path"] = metadata["paths"][0]
+                state["image_paths"] = metadata["paths"]
+                saved = ", ".join(
+                    f"{record['name']} ({record['path']}" + (f", seed {record['seed']})" if record.get("seed") else ")")
+                    for record in records
+                )
+                action = "reused from an identical earlier request" if metadata["cached"] else "generated and saved"
+                state["messages"].append({
+                    "role": "assistant",
+                    "content": f"Image {action} as: {saved}\nPrompt used: {metadata['prompt']}"
+                })
+
+                # Add image metadata
+                state["image_metadata"] = metadata
                 
             except requests.exceptions.RequestException as e:
                 error_msg = "Network error occurred while generating image"
@@ -112,4 +226,8 @@ def create_image_generator_agent():
         
         return state
 
-    return generate_image 
\ No newline at end of file
+    return generate_image 
+
+def create_image_generator_agent_async():
+    """Async image generator node"""
+    return as_async_node(create_image_generator_agent())
@@ -1,13 +1,14 @@
 from typing import Dict
 from ..core.state import AgentState
-from ..utils.console import console
+from ..utils.console import console, agent_status
 from ..config.settings import co
+from ..utils.concurrency import as_async_node
 
 def create_playlist_generator_agent():
     def generate_playlist(state: AgentState) -> AgentState:
         """Music playlist generator that creates personalized playlists"""
         
-        with console.status("[bold blue]Creating your playlist...", spinner="dots") as status:
+        with agent_status("[bold blue]Creating your playlist...") as status:
             try:
                 # Initialize state if needed
                 if "messages" not in state:
@@ -98,6 +99,7 @@ def create_playlist_generator_agent():
                     prompt=prompt,
                     max_tokens=1000,
                     temperature=0.7,
+                    agent="playlist_generator",
                 )
                 
                 playlist = response.generations[0].text.strip()
@@ -137,4 +139,8 @@ def create_playlist_generator_agent():
         
         return state
 
-    return generate_playlist 
\ No newline at end of file
+    return generate_playlist 
+
+def create_playlist_generator_agent_async():
+    """Async playlist generator node"""
+    return as_async_node(create_playlist_generator_agent())
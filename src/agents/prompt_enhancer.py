@@ -1,10 +1,11 @@
 from typing import Dict
 from ..core.state import AgentState
-from ..utils.console import console
+from ..utils.console import console, agent_status
 from ..config.settings import co
+from ..utils.concurrency import as_async_node
 
 def create_prompt_enhancer_agent():
-    def enhance_prompt(state: AgentState) -> AgentState:
+    def enhance_prompt(state: AgentState, retry: bool = False) -> AgentState:
         """Interactive prompt enhancement agent"""
         
         initial_prompt = state["messages"][-1]["content"]
@@ -89,7 +90,7 @@ def create_prompt_enhancer_agent():
         additional_details = input().strip()
         
         # Construct the enhanced prompt
-        with console.status("[bold blue]Enhancing prompt...", spinner="dots") as status:
+        with agent_status("[bold blue]Enhancing prompt...") as status:
             try:
                 prompt_template = f"""
                 Original concept: {initial_prompt}
@@ -108,6 +109,9 @@ def create_prompt_enhancer_agent():
                     prompt=prompt_template,
                     max_tokens=300,
                     temperature=0.7,
+                    agent="prompt_enhancer",
+                    # The user rejected the last prompt, so never hand it back from the cache
+                    use_cache=not retry,
                 )
                 
                 enhanced_prompt = response.generations[0].text.strip()
@@ -124,7 +128,7 @@ def create_prompt_enhancer_agent():
                         break
                     elif confirm in ['no', 'n']:
                         console.print("\n[yellow]Let's try again![/yellow]")
-                        return enhance_prompt(state)  # Restart the process
+                        return enhance_prompt(state, retry=True)  # Restart the process
                     else:
                         console.print("[red]Please enter 'yes' or 'no'[/red]")
                 
@@ -134,4 +138,8 @@ def create_prompt_enhancer_agent():
         
         return state
 
-    return enhance_prompt 
\ No newline at end of file
+    return enhance_prompt 
+
+def create_prompt_enhancer_agent_async():
+    """Async prompt enhancer node, kept on the main thread for its input() prompts"""
+    return as_async_node(create_prompt_enhancer_agent(), interactive=True)
@@ -1,8 +1,12 @@
 from typing import Dict
 from ..core.state import AgentState
-from ..utils.console import console
+from ..utils.console import console, agent_status
 import cohere
-from ..config.settings import co
+from ..config.settings import co, aco
+
+def research_prompt(last_message: str) -> str:
+    return f"""As a research agent, gather and summarize key information about: {last_message}
+                    Focus on collecting factual information and important details."""
 
 def create_researcher_agent():
     def research(state: AgentState) -> AgentState:
@@ -10,13 +14,37 @@ def create_researcher_agent():
         
         last_message = state["messages"][-1]["content"]
         
-        with console.status("[bold green]Researching...", spinner="dots") as status:
+        with agent_status("[bold green]Researching...") as status:
             try:
                 response = co.generate(
-                    prompt=f"""As a research agent, gather and summarize key information about: {last_message}
-                    Focus on collecting factual information and important details.""",
+                    prompt=research_prompt(last_message),
+                    max_tokens=300,
+                    temperature=0.7,
+                    agent="researcher",
+                )
+                
+                state["research_results"] = response.generations[0].text.strip()
+                
+            except Exception as e:
+                console.print(f"\n[red]Error in research: {e}[/red]")
+        
+        return state
+
+    return research
+
+def create_researcher_agent_async():
+    async def research(state: AgentState) -> AgentState:
+        """Async research agent that gathers information"""
+        
+        last_message = state["messages"][-1]["content"]
+        
+        with agent_status("[bold green]Researching...") as status:
+            try:
+                response = await aco.generate(
+                    prompt=research_prompt(last_message),
                     max_tokens=300,
                     temperature=0.7,
+                    agent="researcher",
                 )
                 
                 state["research_results"] = response.generations[0].text.strip()
@@ -26,4 +54,4 @@ def create_researcher_agent():
         
         return state
 
-    return research 
\ No newline at end of file
+    return research
@@ -1,49 +1,163 @@
 from typing import Dict
+from collections import OrderedDict
+import hashlib
+import threading
 from ..core.state import AgentState
-from ..utils.console import console
-from ..config.settings import co
+from ..utils.console import console, agent_status
+from ..config.settings import (
+    co, llm_max_concurrency, summary_eager, summary_chunk_tokens, summary_fan_out,
+    summary_extractive, summary_extractive_tokens
+)
+from ..utils.concurrency import run_concurrently, as_async_node
+from ..utils.text import estimate_tokens, chunk_text
+from ..utils.extractive import extract_key_sentences
+
+SUMMARY_LENGTHS = ["short", "medium", "long"]
+
+# Number of source texts whose summaries are kept in memory
+SUMMARY_MEMO_SIZE = 32
+
+# Maximum length of each partial summary in the map-reduce passes
+CHUNK_SUMMARY_TOKENS = 200
 
 def create_summarizer_agent():
+    # Summaries generated so far, keyed by a hash of the source text
+    summary_memo = OrderedDict()
+    # Condensed versions of long texts, keyed the same way
+    condensed_memo = OrderedDict()
+
+    def generate_summary(text_to_summarize, length):
+        tokens = 100 if length == "short" else 200 if length == "medium" else 300
+
+        response = co.generate(
+            prompt=f"""Create a {length} summary of this text: {text_to_summarize}
+            Focus on the most important points and maintain coherence.
+            For a {length} summary, be {'very concise' if length == 'short'
+            else 'moderately detailed' if length == 'medium'
+            else 'comprehensive'}.""",
+            max_tokens=tokens,
+            temperature=0.7,
+            agent="summarizer",
+        )
+
+        return response.generations[0].text.strip()
+
+    def condense_text(text, status):
+        """Map-reduce a long text until it fits in a single summary prompt"""
+        level = 1
+        while estimate_tokens(text) > summary_chunk_tokens:
+            chunks = chunk_text(text, summary_chunk_tokens)
+            completed = [0]
+            lock = threading.Lock()
+
+            def summarize_chunk(chunk):
+                response = co.generate(
+                    prompt=f"""Summarize this section of a longer document: {chunk}
+                    Keep the key facts, names and figures so it can be combined with the other sections.""",
+                    max_tokens=CHUNK_SUMMARY_TOKENS,
+                    temperature=0.7,
+                    agent="summarizer",
+                )
+
+                # Report progress as chunks finish
+                with lock:
+                    completed[0] += 1
+                    status.update(f"[bold blue]Summarizing (pass {level}): chunk {completed[0]}/{len(chunks)}...")
+
+                return response.generations[0].text.strip()
+
+            results = run_concurrently(summarize_chunk, chunks, max_workers=summary_fan_out)
+
+            partials = []
+            for index, (partial, error) in enumerate(results, 1):
+                if error is not None:
+                    console.print(f"\n[yellow]Warning: chunk {index} of pass {level} failed: {error}[/yellow]")
+                else:
+                    partials.append(partial)
+
+            if not partials:
+                raise Exception("Every chunk of the document failed to summarize")
+
+            condensed = "\n\n".join(partials)
+
+            # Stop if a pass no longer makes the text any shorter
+            if estimate_tokens(condensed) >= estimate_tokens(text):
+                break
+
+            text = condensed
+            level += 1
+
+        return text
+
     def summarize(state: AgentState) -> AgentState:
         """Summarizer agent that creates concise summaries of long texts"""
-        
-        with console.status("[bold blue]Summarizing...", spinner="dots") as status:
+
+        with agent_status("[bold blue]Summarizing...") as status:
             try:
                 # Get the text to summarize
                 text_to_summarize = state["messages"][-1]["content"]
-                
+
                 # Handle empty or invalid input
                 if not text_to_summarize or len(text_to_summarize.strip()) < 10:
                     raise ValueError("Text is too short to summarize")
 
-                # Create summary with different lengths
-                summaries = {}
-                
-                # Generate summaries of different lengths
-                for length in ["short", "medium", "long"]:
-                    tokens = 100 if length == "short" else 200 if length == "medium" else 300
-                    
-                    response = co.generate(
-                        prompt=f"""Create a {length} summary of this text: {text_to_summarize}
-                        Focus on the most important points and maintain coherence.
-                        For a {length} summary, be {'very concise' if length == 'short' 
-                        else 'moderately detailed' if length == 'medium' 
-                        else 'comprehensive'}.""",
-                        max_tokens=tokens,
-                        temperature=0.7,
-                    )
-                    
-                    summaries[length] = response.generations[0].text.strip()
-                
-                state["summaries"] = summaries
-                
-                # Add the medium summary to messages by default
+                requested = state.get("summary_type") or "medium"
+                if requested not in SUMMARY_LENGTHS:
+                    requested = "medium"
+
+                # Look up summaries already generated for this text
+                text_key = hashlib.sha256(text_to_summarize.encode("utf-8")).hexdigest()
+                summaries = summary_memo.setdefault(text_key, {})
+                summary_memo.move_to_end(text_key)
+                while len(summary_memo) > SUMMARY_MEMO_SIZE:
+                    summary_memo.popitem(last=False)
+
+                # Only generate the requested length unless eager mode is on
+                lengths = SUMMARY_LENGTHS if summary_eager else [requested]
+                missing = [length for length in lengths if length not in summaries]
+
+                # Long documents are condensed first, locally and then with map-reduce
+                source_text = text_to_summarize
+                condense_limit = min(summary_chunk_tokens, summary_extractive_tokens) if summary_extractive else summary_chunk_tokens
+                if missing and estimate_tokens(text_to_summarize) > condense_limit:
+                    if text_key not in condensed_memo:
+                        condensed = text_to_summarize
+                        if summary_extractive:
+                            status.update("[bold blue]Extracting key sentences...")
+                            condensed = extract_key_sentences(condensed, summary_extractive_tokens)
+                        condensed_memo[text_key] = condense_text(condensed, status)
+                        while len(condensed_memo) > SUMMARY_MEMO_SIZE:
+                            condensed_memo.popitem(last=False)
+                    source_text = condensed_memo[text_key]
+                    status.update("[bold blue]Summarizing...")
+
+                results = run_concurrently(
+                    lambda length: generate_summary(source_text, length),
+                    missing,
+                    max_workers=llm_max_concurrency,
+                )
+
+                for length, (summary, error) in zip(missing, results):
+                    if error is not None:
+                        console.print(f"\n[yellow]Warning: {length} summary failed: {error}[/yellow]")
+                    else:
+                        summaries[length] = summary
+
+                if not summaries:
+                    raise Exception("All summary variants failed")
+
+                # Keep the available variants in a fixed order
+                state["summaries"] = {length: summaries[length] for length in SUMMARY_LENGTHS if length in summaries}
+
+                shown = requested if requested in summaries else next(iter(state["summaries"]))
+                others = [length for length in SUMMARY_LENGTHS if length != shown]
+
                 state["messages"].append({
                     "role": "assistant",
-                    "content": f"Here's a summary:\n\n{summaries['medium']}\n\n" +
-                    "(Type 'short' or 'long' to see other summary lengths)"
+                    "content": f"Here's the {shown} summary:\n\n{summaries[shown]}\n\n" +
+                    f"(Type '{others[0]}' or '{others[1]}' to see other summary lengths)"
                 })
-                
+
             except ValueError as ve:
                 console.print(f"\n[yellow]Warning: {ve}[/yellow]")
                 state["messages"].append({
@@ -56,7 +170,11 @@ def create_summarizer_agent():
                     "role": "assistant",
                     "content": "I encountered an error while creating the summary. Please try again."
                 })
-        
+
         return state
 
-    return summarize 
\ No newline at end of file
+    return summarize
+
+def create_summarizer_agent_async():
+    """Async summarizer node"""
+    return as_async_node(create_summarizer_agent())
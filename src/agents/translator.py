@@ -1,61 +1,294 @@
 from typing import Dict
+from collections import OrderedDict
+import os
 from ..core.state import AgentState
-from ..utils.console import console
-from ..config.settings import co
+from ..utils.console import console, agent_status
+from ..config.settings import (
+    co, llm_max_concurrency, language_detect_confidence, language_detect_min_chars,
+    translation_segment_tokens, translation_memory, stream_responses
+)
+from ..utils.concurrency import run_concurrently, iter_concurrently, as_async_node
+from ..utils.text import estimate_tokens, chunk_text
+from ..utils.language_detection import detect_language
+from ..utils.display import stream_to_console
+
+# Short texts only skip the LLM when their script identifies the language
+SHORT_TEXT_CONFIDENCE = 0.9
+
+# A local guess is never enough to leave a text untranslated; below this the
+# LLM confirms that the text is already in the target language
+SAME_LANGUAGE_CONFIDENCE = 0.9
+
+# Number of LLM language detections kept in memory
+DETECTION_MEMO_SIZE = 256
+
+# Translation memory kind for the numbered answers with notes and alternatives;
+# document segments store bare translations under the default kind
+ANNOTATED = "annotated"
+
+# Only the start of a long document is needed to detect its language
+DETECTION_SAMPLE_CHARS = 2000
+
+def output_path_for(output_file, target_lang, multiple):
+    """Give each target language its own output file when there are several"""
+    if not output_file or not multiple:
+        return output_file
+    root, ext = os.path.splitext(output_file)
+    return f"{root}.{target_lang.lower().replace(' ', '_')}{ext}"
 
 def create_translator_agent():
+    # Languages detected by the LLM, keyed by the text
+    detection_memo = OrderedDict()
+
+    def detect_source_language(text):
+        """Detect the language locally, asking the LLM only about ambiguous texts
+
+        Returns (language, confidence); languages named by the LLM have confidence 1.
+        """
+        language, confidence = detect_language(text)
+        is_short = len(text.strip()) < language_detect_min_chars
+        threshold = SHORT_TEXT_CONFIDENCE if is_short else language_detect_confidence
+        if language and confidence >= threshold:
+            return language, confidence
+        
+        return ask_source_language(text), 1.0
+
+    def ask_source_language(text):
+        """Ask the LLM for the language of a text"""
+        if text in detection_memo:
+            detection_memo.move_to_end(text)
+            return detection_memo[text]
+        
+        detect_response = co.generate(
+            prompt=f"Detect the language of this text. Reply with only the language name: {text}",
+            max_tokens=50,
+            temperature=0.3,
+            agent="translator",
+        )
+        source_lang = detect_response.generations[0].text.strip()
+        
+        detection_memo[text] = source_lang
+        while len(detection_memo) > DETECTION_MEMO_SIZE:
+            detection_memo.popitem(last=False)
+        
+        return source_lang
+
+    def lookup_memory(text, source_lang, target_lang, kind=None):
+        """Return (stored translation, reference note) from the translation memory
+
+        Only exact matches are reused as they are. A fuzzy match comes from a
+        different sentence, so it is only passed to the LLM as a reference.
+        """
+        if translation_memory is None:
+            return None, ""
+        match = translation_memory.lookup(source_lang, target_lang, text, kind)
+        if not match:
+            return None, ""
+        if not match["fuzzy"]:
+            return match["translation"], ""
+        
+        console.print(f"[dim]Using a {match['score']:.0%} translation memory match for {target_lang} as a reference[/dim]")
+        return None, f"""
+        
+        A similar text was translated before. Use it only as a reference for terminology, the meaning may differ:
+        Similar text: {match['source']}
+        Its translation: {match['translation']}"""
+
+    def remember(text, source_lang, target_lang, translation, kind=None):
+        """Write a new translation back to the translation memory"""
+        if translation_memory is not None:
+            translation_memory.add(source_lang, target_lang, text, translation, kind)
+
+    def translation_prompt(text, source_lang, target_lang, reference=""):
+        return f"""Translate this text from {source_lang} to {target_lang}:
+        Original: {text}
+        
+        Provide:
+        1. Translation
+        2. Any cultural context or notes
+        3. Alternative expressions if applicable{reference}"""
+
+    def translate_text(text, source_lang, target_lang):
+        """Translate text into a single target language"""
+        stored, reference = lookup_memory(text, source_lang, target_lang, ANNOTATED)
+        if stored is not None:
+            return stored
+        
+        response = co.generate(
+            prompt=translation_prompt(text, source_lang, target_lang, reference),
+            max_tokens=500,
+            temperature=0.7,
+            agent="translator",
+        )
+        
+        translation = response.generations[0].text.strip()
+        remember(text, source_lang, target_lang, translation, ANNOTATED)
+        return translation
+
+    def stream_translation(text, source_lang, target_lang, status):
+        """Translate text into a single target language, printing tokens as they arrive"""
+        title = f"Translation ({source_lang} → {target_lang})"
+        stored, reference = lookup_memory(text, source_lang, target_lang, ANNOTATED)
+        if stored is not None:
+            return stream_to_console([stored], title=title, status=status)
+        
+        translation = stream_to_console(
+            co.generate_stream(
+                prompt=translation_prompt(text, source_lang, target_lang, reference),
+                max_tokens=500,
+                temperature=0.7,
+                agent="translator",
+            ),
+            title=title,
+            status=status,
+        )
+        remember(text, source_lang, target_lang, translation, ANNOTATED)
+        return translation
+
+    def translate_segment(segment, source_lang, target_lang):
+        """Translate one segment of a document, returning only the translated text"""
+        stored, reference = lookup_memory(segment, source_lang, target_lang)
+        if stored is not None:
+            return stored
+        
+        response = co.generate(
+            prompt=f"""Translate this text from {source_lang} to {target_lang}.
+            Reply with only the translation and keep the paragraph breaks.{reference}
+
+            {segment}""",
+            max_tokens=translation_segment_tokens * 3,
+            temperature=0.3,
+            agent="translator",
+        )
+        
+        translation = response.generations[0].text.strip()
+        remember(segment, source_lang, target_lang, translation)
+        return translation
+
+    def translate_document(text, source_lang, target_lang, output_path=None):
+        """Translate a long text segment by segment, streaming the segments in order"""
+        segments = chunk_text(text, translation_segment_tokens)
+        console.print(f"\n[bold green]Translation ({source_lang} → {target_lang}), {len(segments)} segments:[/bold green]")
+        
+        translated = []
+        output = open(output_path, "w", encoding="utf-8") if output_path else None
+        try:
+            results = iter_concurrently(
+                lambda segment: translate_segment(segment, source_lang, target_lang),
+                segments,
+                max_workers=llm_max_concurrency,
+            )
+            
+            # Segments arrive in their original order as soon as they are ready
+            for index, (segment, (translation, error)) in enumerate(zip(segments, results), 1):
+                if error is not None:
+                    console.print(f"\n[yellow]Warning: segment {index} failed, keeping the original: {error}[/yellow]")
+                    translation = segment
+                
+                translated.append(translation)
+                console.print(f"\n{translation}", markup=False, highlight=False)
+                if output:
+                    output.write(translation + "\n\n")
+                    output.flush()
+        finally:
+            if output:
+                output.close()
+        
+        return "\n\n".join(translated)
+
     def translate(state: AgentState) -> AgentState:
         """Translator agent that handles multi-language translation"""
         
-        with console.status("[bold blue]Translating...", spinner="dots") as status:
+        with agent_status("[bold blue]Translating...") as status:
             try:
                 text = state["messages"][-1]["content"]
-                target_lang = state.get("target_language", "English")
+                target_langs = state.get("target_languages") or [state.get("target_language") or "English"]
+                source_file = state.get("source_file")
+                output_file = state.get("output_file")
+                
+                if source_file:
+                    with open(source_file, encoding="utf-8") as f:
+                        text = f.read()
                 
-                # Detect source language first
-                detect_prompt = f"Detect the language of this text: {text}"
-                detect_response = co.generate(
-                    prompt=detect_prompt,
-                    max_tokens=50,
-                    temperature=0.3,
-                )
-                source_lang = detect_response.generations[0].text.strip()
+                # Files and long texts are translated segment by segment
+                document_mode = bool(source_file or output_file) or estimate_tokens(text) > translation_segment_tokens
                 
-                # Skip translation if source and target are the same
-                if source_lang.lower() in target_lang.lower():
+                # Detect source language once for every target
+                sample = text[:DETECTION_SAMPLE_CHARS]
+                source_lang, confidence = detect_source_language(sample)
+                
+                # Skip targets that are the same as the source language
+                pending = [lang for lang in target_langs if source_lang.lower() not in lang.lower()]
+                if len(pending) < len(target_langs) and confidence < SAME_LANGUAGE_CONFIDENCE:
+                    # Related languages look alike locally; check before leaving the text untranslated
+                    source_lang = ask_source_language(sample)
+                    pending = [lang for lang in target_langs if source_lang.lower() not in lang.lower()]
+                if not pending:
                     state["messages"].append({
                         "role": "assistant",
-                        "content": f"The text is already in {target_lang}."
+                        "content": f"The text is already in {target_langs[0]}."
                     })
                     return state
                 
-                # Perform translation
-                translate_prompt = f"""Translate this text from {source_lang} to {target_lang}:
-                Original: {text}
+                translations = {}
+                output_files = {}
+                sections = []
                 
-                Provide:
-                1. Translation
-                2. Any cultural context or notes
-                3. Alternative expressions if applicable"""
+                if document_mode:
+                    # Each language streams its segments while they are translated
+                    results = []
+                    for lang in pending:
+                        output_path = output_path_for(output_file, lang, len(pending) > 1)
+                        try:
+                            results.append((translate_document(text, source_lang, lang, output_path), None))
+                            # The segments were already printed as they arrived
+                            state["response_streamed"] = True
+                            if output_path:
+                                output_files[lang] = output_path
+                        except Exception as e:
+                            results.append((None, e))
+                elif stream_responses and len(pending) == 1:
+                    # A single target is streamed straight to the console
+                    try:
+                        results = [(stream_translation(text, source_lang, pending[0], status), None)]
+                        state["response_streamed"] = True
+                    except Exception as e:
+                        results = [(None, e)]
+                else:
+                    # Translate into every target language concurrently
+                    results = run_concurrently(
+                        lambda lang: translate_text(text, source_lang, lang),
+                        pending,
+                        max_workers=llm_max_concurrency,
+                    )
                 
-                response = co.generate(
-                    prompt=translate_prompt,
-                    max_tokens=500,
-                    temperature=0.7,
-                )
+                for lang, (translation, error) in zip(pending, results):
+                    if error is not None:
+                        console.print(f"\n[yellow]Warning: translation to {lang} failed: {error}[/yellow]")
+                        sections.append(f"Translation ({source_lang} → {lang}) failed: {error}")
+                    elif lang in output_files:
+                        translations[lang] = translation
+                        sections.append(f"Translation ({source_lang} → {lang}) saved to: {output_files[lang]}")
+                    else:
+                        translations[lang] = translation
+                        sections.append(f"Translation ({source_lang} → {lang}):\n\n{translation}")
                 
-                translation = response.generations[0].text.strip()
+                if not translations:
+                    raise Exception(results[0][1])
                 
+                first_lang = next(iter(translations))
                 state["translation_results"] = {
                     "source_language": source_lang,
-                    "target_language": target_lang,
+                    "target_language": first_lang,
                     "original_text": text,
-                    "translated_text": translation
+                    "translated_text": translations[first_lang],
+                    "translations": translations,
+                    "output_files": output_files
                 }
                 
                 state["messages"].append({
                     "role": "assistant",
-                    "content": f"Translation ({source_lang} → {target_lang}):\n\n{translation}"
+                    "content": "\n\n".join(sections)
                 })
                 
             except Exception as e:
@@ -68,4 +301,8 @@ def create_translator_agent():
         return state
     
 
-    return translate 
\ No newline at end of file
+    return translate
+
+def create_translator_agent_async():
+    """Async translator node"""
+    return as_async_node(create_translator_agent())
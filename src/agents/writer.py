@@ -1,26 +1,84 @@
 from typing import Dict
 from ..core.state import AgentState
-from ..utils.console import console
-from ..config.settings import co
+from ..utils.console import console, agent_status
+from ..config.settings import co, aco, stream_responses
+from ..utils.display import stream_to_console, astream_to_console
+
+def writer_prompt(state: AgentState) -> str:
+    return f"""As a writing agent, create a well-structured response using:
+                    Research: {state['research_results']}
+                    Analysis: {state['analysis_results']}
+                    Make it engaging and easy to understand."""
 
 def create_writer_agent():
     def write(state: AgentState) -> AgentState:
         """Writer agent that creates the final response"""
         
-        with console.status("[bold yellow]Composing response...", spinner="dots") as status:
+        with agent_status("[bold yellow]Composing response...") as status:
             try:
-                response = co.generate(
-                    prompt=f"""As a writing agent, create a well-structured response using:
-                    Research: {state['research_results']}
-                    Analysis: {state['analysis_results']}
-                    Make it engaging and easy to understand.""",
-                    max_tokens=300,
-                    temperature=0.7,
-                )
+                if stream_responses:
+                    content = stream_to_console(
+                        co.generate_stream(
+                            prompt=writer_prompt(state),
+                            max_tokens=300,
+                            temperature=0.7,
+                            agent="writer",
+                        ),
+                        title="Final Response",
+                        status=status,
+                    )
+                    state["response_streamed"] = True
+                else:
+                    response = co.generate(
+                        prompt=writer_prompt(state),
+                        max_tokens=300,
+                        temperature=0.7,
+                        agent="writer",
+                    )
+                    content = response.generations[0].text.strip()
+                
+                state["messages"].append({
+                    "role": "assistant",
+                    "content": content
+                })
+                
+            except Exception as e:
+                console.print(f"\n[red]Error in writing: {e}[/red]")
+        
+        return state
+
+    return write
+
+def create_writer_agent_async():
+    async def write(state: AgentState) -> AgentState:
+        """Async writer agent that creates the final response"""
+        
+        with agent_status("[bold yellow]Composing response...") as status:
+            try:
+                if stream_responses:
+                    content = await astream_to_console(
+                        aco.generate_stream(
+                            prompt=writer_prompt(state),
+                            max_tokens=300,
+                            temperature=0.7,
+                            agent="writer",
+                        ),
+                        title="Final Response",
+                        status=status,
+                    )
+                    state["response_streamed"] = True
+                else:
+                    response = await aco.generate(
+                        prompt=writer_prompt(state),
+                        max_tokens=300,
+                        temperature=0.7,
+                        agent="writer",
+                    )
+                    content = response.generations[0].text.strip()
                 
                 state["messages"].append({
                     "role": "assistant",
-                    "content": response.generations[0].text.strip()
+                    "content": content
                 })
                 
             except Exception as e:
@@ -28,4 +86,4 @@ def create_writer_agent():
         
         return state
 
-    return write 
\ No newline at end of file
+    return write
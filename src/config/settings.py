@@ -1,10 +1,148 @@
 import os
 import cohere
 from dotenv import load_dotenv
+from ..utils.llm_cache import ResponseCache, CachedClient, AsyncCachedClient
+from ..utils.translation_memory import TranslationMemory
+from ..utils.http import create_session, RETRY_STATUS_CODES
+from ..utils.image_store import ImageStore
+from ..utils.image_derivatives import DerivativePipeline
+from ..utils.image_metadata import ImageMetadataIndex
+from .storage import image_store_path, image_metadata_path
 
 # Load environment variables
 load_dotenv()
 
+# LLM response cache settings
+llm_cache_enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+llm_cache_path = os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+llm_cache_max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+llm_cache_ttl = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+# Creative agents whose users expect a fresh answer when they ask again
+llm_cache_disabled_agents = [
+    agent.strip()
+    for agent in os.getenv("LLM_CACHE_DISABLED_AGENTS", "prompt_enhancer,playlist_generator").split(",")
+    if agent.strip()
+]
+cohere_model = os.getenv("COHERE_MODEL") or None
+
+# Maximum number of LLM requests an agent issues at once
+llm_max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+
+# Generate every summary length up front instead of only the requested one
+summary_eager = os.getenv("SUMMARY_EAGER", "false").lower() in ("1", "true", "yes")
+
+# Texts longer than this many tokens are summarized chunk by chunk
+summary_chunk_tokens = int(os.getenv("SUMMARY_CHUNK_TOKENS", "2000"))
+summary_fan_out = int(os.getenv("SUMMARY_FAN_OUT", str(llm_max_concurrency)))
+
+# Optional local extractive pass that trims long texts before they reach the LLM
+summary_extractive = os.getenv("SUMMARY_EXTRACTIVE", "false").lower() in ("1", "true", "yes")
+summary_extractive_tokens = int(os.getenv("SUMMARY_EXTRACTIVE_TOKENS", "1500"))
+
+# Print model output token by token as it is generated
+stream_responses = os.getenv("STREAM_RESPONSES", "true").lower() in ("1", "true", "yes")
+
+# Chat history kept verbatim, with older turns folded into a summary of this size
+history_token_budget = int(os.getenv("HISTORY_TOKEN_BUDGET", "4000"))
+history_summary_tokens = int(os.getenv("HISTORY_SUMMARY_TOKENS", "500"))
+
+# Seconds allowed for explaining a single code block
+code_explain_timeout = float(os.getenv("CODE_EXPLAIN_TIMEOUT", "60"))
+
+# Local language detection; shorter or less confident texts are sent to the LLM
+language_detect_confidence = float(os.getenv("LANGUAGE_DETECT_CONFIDENCE", "0.1"))
+language_detect_min_chars = int(os.getenv("LANGUAGE_DETECT_MIN_CHARS", "20"))
+
+# Texts longer than this many tokens are translated segment by segment
+translation_segment_tokens = int(os.getenv("TRANSLATION_SEGMENT_TOKENS", "400"))
+
+# Translation memory settings
+translation_memory_enabled = os.getenv("TRANSLATION_MEMORY_ENABLED", "true").lower() not in ("0", "false", "no")
+translation_memory_path = os.getenv("TRANSLATION_MEMORY_PATH", ".cache/translation_memory.sqlite3")
+translation_memory_fuzzy_threshold = float(os.getenv("TRANSLATION_MEMORY_FUZZY_THRESHOLD", "0.95"))
+
+# Stability API connection settings
+stability_connect_timeout = float(os.getenv("STABILITY_CONNECT_TIMEOUT", "10"))
+stability_read_timeout = float(os.getenv("STABILITY_READ_TIMEOUT", "120"))
+stability_max_retries = int(os.getenv("STABILITY_MAX_RETRIES", "3"))
+stability_backoff = float(os.getenv("STABILITY_BACKOFF", "1.0"))
+
+# Identical image requests are answered from disk instead of calling the API again
+image_cache_enabled = os.getenv("IMAGE_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+image_cache_max_entries = int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", "500"))
+
+# Thumbnails and converted copies made in the background after each image is saved
+image_thumbnail_size = int(os.getenv("IMAGE_THUMBNAIL_SIZE", "256"))
+image_derivative_formats = [
+    name.strip().lower() for name in os.getenv("IMAGE_DERIVATIVE_FORMATS", "").split(",") if name.strip()
+]
+image_derivative_quality = int(os.getenv("IMAGE_DERIVATIVE_QUALITY", "85"))
+image_keep_original = os.getenv("IMAGE_KEEP_ORIGINAL", "true").lower() not in ("0", "false", "no")
+image_pipeline_workers = int(os.getenv("IMAGE_PIPELINE_WORKERS", "2"))
+
+# Batch image generation (batch.py)
+batch_queue_path = os.getenv("BATCH_QUEUE_PATH", ".cache/batch_queue.sqlite3")
+batch_max_concurrency = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+batch_max_attempts = int(os.getenv("BATCH_MAX_ATTEMPTS", "3"))
+
+# Download single images as raw PNG bytes instead of base64 JSON
+stability_binary_download = os.getenv("STABILITY_BINARY_DOWNLOAD", "true").lower() in ("1", "true", "yes")
+
 # Initialize clients
-co = cohere.Client(os.getenv("COHERE_API_KEY"))
-stability_api_key = os.getenv("STABILITY_API_KEY") 
\ No newline at end of file
+response_cache = ResponseCache(
+    llm_cache_path,
+    max_entries=llm_cache_max_entries,
+    ttl=llm_cache_ttl,
+) if llm_cache_enabled else None
+
+co = CachedClient(
+    cohere.Client(os.getenv("COHERE_API_KEY")),
+    cache=response_cache,
+    model=cohere_model,
+    disabled_agents=llm_cache_disabled_agents,
+)
+
+# Async client for workflows run with ainvoke
+aco = AsyncCachedClient(
+    cohere.AsyncClient(os.getenv("COHERE_API_KEY")),
+    cache=response_cache,
+    model=cohere_model,
+    disabled_agents=llm_cache_disabled_agents,
+)
+
+translation_memory = TranslationMemory(
+    translation_memory_path,
+    fuzzy_threshold=translation_memory_fuzzy_threshold,
+) if translation_memory_enabled else None
+
+stability_api_key = os.getenv("STABILITY_API_KEY")
+
+image_store = ImageStore(image_store_path, cache_max_entries=image_cache_max_entries)
+
+# Prompts and settings of every stored image, searchable with gallery.py
+image_metadata_index = ImageMetadataIndex(image_metadata_path)
+
+derivative_pipeline = DerivativePipeline(
+    image_store,
+    thumbnail_size=image_thumbnail_size,
+    formats=image_derivative_formats,
+    quality=image_derivative_quality,
+    keep_original=image_keep_original,
+    max_workers=image_pipeline_workers,
+)
+
+# One pooled session shared by every image generation, so connections are reused
+stability_session = create_session(
+    max_retries=stability_max_retries,
+    backoff_factor=stability_backoff,
+    # Enough pooled connections for every request a batch keeps in flight
+    pool_size=max(4, batch_max_concurrency),
+)
+
+# The batch runner adapts its concurrency to 429s, so it has to see them as soon as they happen
+batch_session = create_session(
+    max_retries=stability_max_retries,
+    backoff_factor=stability_backoff,
+    pool_size=max(4, batch_max_concurrency),
+    retry_statuses=tuple(code for code in RETRY_STATUS_CODES if code != 429),
+)
@@ -0,0 +1,14 @@
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Storage locations only, so tools that just read the image indexes (gallery.py)
+# don't have to build the API clients in settings
+
+# Generated images are stored by content hash under this directory
+image_store_path = os.getenv("IMAGE_STORE_PATH", "generated_images")
+
+# Prompts and settings of every stored image, searchable with gallery.py
+image_metadata_path = os.path.join(image_store_path, "metadata.sqlite3")
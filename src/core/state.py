@@ -9,24 +9,31 @@ class AgentState(TypedDict):
     current_task: str
     task_status: str
     workflow_type: str
+    response_streamed: Optional[bool]
     research_results: Optional[str]
     analysis_results: Optional[str]
     final_response: Optional[str]
     enhanced_prompt: Optional[str]
     image_path: Optional[str]
+    image_paths: Optional[List[str]]
     # New fields for image generation
     style_preference: Optional[str]
     num_samples: Optional[int]
     image_width: Optional[int]
     image_height: Optional[int]
+    seed: Optional[int]
     image_metadata: Optional[Dict]
     # New fields for summarizer
     summaries: Optional[Dict[str, str]]
+    summary_type: Optional[str]
     # New fields for code explainer
     code_explanation: Optional[str]
     # New fields for translation
     translation_results: Optional[Dict]
     target_language: Optional[str]
+    target_languages: Optional[List[str]]
+    source_file: Optional[str]
+    output_file: Optional[str]
     # New fields for grammar checking
     grammar_analysis: Optional[Dict]
     check_type: Optional[str]
@@ -1,22 +1,32 @@
 from langgraph.graph import Graph
-from ..agents.researcher import create_researcher_agent
-from ..agents.analyzer import create_analyzer_agent
-from ..agents.writer import create_writer_agent
-from ..agents.prompt_enhancer import create_prompt_enhancer_agent
-from ..agents.image_generator import create_image_generator_agent
-from ..agents.summarizer import create_summarizer_agent
-from ..agents.code_explainer import create_code_explainer_agent
-from ..agents.translator import create_translator_agent
-from ..agents.grammar_checker import create_grammar_checker_agent
-from ..agents.playlist_generator import create_playlist_generator_agent
+from ..agents.researcher import create_researcher_agent, create_researcher_agent_async
+from ..agents.analyzer import create_analyzer_agent, create_analyzer_agent_async
+from ..agents.writer import create_writer_agent, create_writer_agent_async
+from ..agents.prompt_enhancer import create_prompt_enhancer_agent, create_prompt_enhancer_agent_async
+from ..agents.image_generator import create_image_generator_agent, create_image_generator_agent_async
+from ..agents.summarizer import create_summarizer_agent, create_summarizer_agent_async
+from ..agents.code_explainer import create_code_explainer_agent, create_code_explainer_agent_async
+from ..agents.translator import create_translator_agent, create_translator_agent_async
+from ..agents.grammar_checker import create_grammar_checker_agent, create_grammar_checker_agent_async
+from ..agents.playlist_generator import create_playlist_generator_agent, create_playlist_generator_agent_async
 
-def create_research_workflow():
+def create_research_workflow(use_async: bool = False):
+    """Create the research workflow; async workflows must be run with ainvoke"""
     workflow = Graph()
     
+    if use_async:
+        researcher = create_researcher_agent_async()
+        analyzer = create_analyzer_agent_async()
+        writer = create_writer_agent_async()
+    else:
+        researcher = create_researcher_agent()
+        analyzer = create_analyzer_agent()
+        writer = create_writer_agent()
+    
     # Add research agents
-    workflow.add_node("researcher", create_researcher_agent())
-    workflow.add_node("analyzer", create_analyzer_agent())
-    workflow.add_node("writer", create_writer_agent())
+    workflow.add_node("researcher", researcher)
+    workflow.add_node("analyzer", analyzer)
+    workflow.add_node("writer", writer)
     workflow.add_node("output", lambda state: dict(state))
     
     # Connect the agents in sequence
@@ -28,12 +38,20 @@ def create_research_workflow():
     
     return workflow.compile()
 
-def create_image_workflow():
+def create_image_workflow(use_async: bool = False):
+    """Create the image generation workflow"""
     workflow = Graph()
     
+    if use_async:
+        prompt_enhancer = create_prompt_enhancer_agent_async()
+        image_generator = create_image_generator_agent_async()
+    else:
+        prompt_enhancer = create_prompt_enhancer_agent()
+        image_generator = create_image_generator_agent()
+    
     # Add image generation agents
-    workflow.add_node("prompt_enhancer", create_prompt_enhancer_agent())
-    workflow.add_node("image_generator", create_image_generator_agent())
+    workflow.add_node("prompt_enhancer", prompt_enhancer)
+    workflow.add_node("image_generator", image_generator)
     workflow.add_node("output", lambda state: dict(state))
     
     # Connect the agents in sequence
@@ -44,12 +62,12 @@ def create_image_workflow():
     
     return workflow.compile()
 
-def create_summary_workflow():
+def create_summary_workflow(use_async: bool = False):
     """Create a workflow for text summarization"""
     workflow = Graph()
     
     # Create the summarizer function
-    summarizer = create_summarizer_agent()
+    summarizer = create_summarizer_agent_async() if use_async else create_summarizer_agent()
     
     # Add nodes to the graph
     workflow.add_node("summarizer", summarizer)
@@ -63,12 +81,12 @@ def create_summary_workflow():
     # Return the compiled workflow
     return workflow.compile()
 
-def create_code_explanation_workflow():
+def create_code_explanation_workflow(use_async: bool = False):
     """Create a workflow for code explanation"""
     workflow = Graph()
     
     # Create the code explainer function
-    code_explainer = create_code_explainer_agent()
+    code_explainer = create_code_explainer_agent_async() if use_async else create_code_explainer_agent()
     
     # Add nodes to the graph
     workflow.add_node("code_explainer", code_explainer)
@@ -82,11 +100,11 @@ def create_code_explanation_workflow():
     # Return the compiled workflow
     return workflow.compile()
 
-def create_translation_workflow():
+def create_translation_workflow(use_async: bool = False):
     """Create a workflow for translation"""
     workflow = Graph()
     
-    translator = create_translator_agent()
+    translator = create_translator_agent_async() if use_async else create_translator_agent()
     
     workflow.add_node("translator", translator)
     workflow.add_node("output", lambda state: dict(state))
@@ -97,11 +115,11 @@ def create_translation_workflow():
     
     return workflow.compile()
 
-def create_grammar_workflow():
+def create_grammar_workflow(use_async: bool = False):
     """Create a workflow for grammar checking"""
     workflow = Graph()
     
-    grammar_checker = create_grammar_checker_agent()
+    grammar_checker = create_grammar_checker_agent_async() if use_async else create_grammar_checker_agent()
     
     workflow.add_node("grammar_checker", grammar_checker)
     workflow.add_node("output", lambda state: dict(state))
@@ -112,11 +130,11 @@ def create_grammar_workflow():
     
     return workflow.compile()
 
-def create_playlist_workflow():
+def create_playlist_workflow(use_async: bool = False):
     """Create a workflow for playlist generation"""
     workflow = Graph()
     
-    playlist_generator = create_playlist_generator_agent()
+    playlist_generator = create_playlist_generator_agent_async() if use_async else create_playlist_generator_agent()
     
     workflow.add_node("playlist_generator", playlist_generator)
     workflow.add_node("output", lambda state: dict(state))
@@ -0,0 +1,102 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+def run_concurrently(func: Callable, items: Iterable, max_workers: int = 4,
+                     timeout: Optional[float] = None) -> List[Tuple[Any, Optional[Exception]]]:
+    """Run func over items in a bounded thread pool
+
+    Returns one (result, error) pair per item, in the original order. A failing
+    or timed-out item gets its exception in the error slot instead of raising,
+    so one bad item never discards the others.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    started = {}
+
+    def run(index, item):
+        started[index] = time.monotonic()
+        return func(item)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    futures = [executor.submit(run, index, item) for index, item in enumerate(items)]
+    results = []
+
+    try:
+        for index, future in enumerate(futures):
+            try:
+                if timeout is None:
+                    results.append((future.result(), None))
+                    continue
+
+                # The timeout applies from when the item starts running, not
+                # from when it was queued behind other items
+                while True:
+                    try:
+                        results.append((future.result(timeout=0.05), None))
+                        break
+                    except FuturesTimeoutError:
+                        if future.done():
+                            raise
+                        start = started.get(index)
+                        if start is not None and time.monotonic() - start > timeout:
+                            raise TimeoutError(f"Timed out after {timeout} seconds")
+            except Exception as e:
+                future.cancel()
+                results.append((None, e))
+    finally:
+        # Don't block on calls that are still hanging after a timeout
+        executor.shutdown(wait=False)
+
+    return results
+
+
+def iter_concurrently(func: Callable, items: Iterable, max_workers: int = 4) -> Iterator[Tuple[Any, Optional[Exception]]]:
+    """Run func over items in a bounded thread pool, yielding results in order
+
+    Each (result, error) pair is yielded as soon as that item and every item
+    before it have finished, so callers can stream output while later items
+    are still running.
+    """
+    items = list(items)
+    if not items:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    futures = [executor.submit(func, item) for item in items]
+
+    try:
+        for future in futures:
+            try:
+                yield future.result(), None
+            except Exception as e:
+                yield None, e
+    finally:
+        # Stop queued work if the caller gives up early
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def as_async_node(node: Callable, interactive: bool = False) -> Callable:
+    """Wrap a blocking workflow node so it runs in a worker thread under ainvoke
+
+    The agents block on the synchronous API clients and fan their own work out
+    to thread pools, so a worker thread per node keeps the event loop free
+    without rewriting them as coroutines. Interactive nodes (ones that call
+    input()) run on the event loop's own thread instead, so they keep the
+    terminal and Ctrl+C reaches them.
+    """
+
+    @functools.wraps(node)
+    async def async_node(state):
+        if interactive:
+            return node(state)
+        return await asyncio.to_thread(node, state)
+
+    return async_node
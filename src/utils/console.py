@@ -1,8 +1,38 @@
+from contextlib import contextmanager
 from rich.console import Console
+from rich.errors import LiveError
 
 # Initialize Rich console for better formatting
 console = Console()
 
 def clear_screen():
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear') 
\ No newline at end of file
+    # Rich writes the escape codes itself, no shell is spawned
+    console.clear()
+
+class _SilentStatus:
+    """Stand-in for a status spinner when another one is already showing"""
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def stop(self):
+        pass
+
+@contextmanager
+def agent_status(message, spinner="dots"):
+    """Show a status spinner, or stay silent if another agent's spinner is active
+
+    Only one live display can be on screen at a time, so agents running
+    concurrently (async workflows, several sessions) share the first spinner.
+    """
+    status = console.status(message, spinner=spinner)
+    try:
+        status.start()
+    except LiveError:
+        yield _SilentStatus()
+        return
+    
+    try:
+        yield status
+    finally:
+        status.stop()
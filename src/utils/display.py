@@ -1,52 +1,81 @@
-import time
-from .console import console, clear_screen
+from .console import console
 
-def print_chat_history(messages, state=None):
-    clear_screen()
-    console.print("\n[bold blue]=== Chat History ===[/bold blue]")
-    console.print("[blue]-------------------[/blue]")
-    
-    # Print all previous messages normally
-    if len(messages) > 2:
-        for message in messages[:-2]:
-            role = "[bold cyan]You[/bold cyan]" if message["role"] == "user" else "[bold green]Assistant[/bold green]"
-            console.print(f"\n{role}:")
-            console.print(message["content"])
+# Intermediate results shown as soon as the agent that produced them finishes
+AGENT_SECTIONS = {
+    "researcher": ("research_results", "[bold magenta]Research Findings:[/bold magenta]"),
+    "analyzer": ("analysis_results", "[bold yellow]Analysis:[/bold yellow]"),
+    "image_generator": ("image_paths", "[bold yellow]Image Generated:[/bold yellow]"),
+}
+
+def _start_stream(chunk, parts, title, status):
+    """Strip leading whitespace and print the title before the first chunk"""
+    if not parts:
+        chunk = chunk.lstrip()
+        if not chunk:
+            return ""
+        if status is not None:
+            status.stop()
+        if title:
+            console.print(f"\n[bold green]{title}:[/bold green]")
+    return chunk
+
+def stream_to_console(chunks, title=None, status=None) -> str:
+    """Print text chunks as they arrive from the model and return the full text"""
+    parts = []
+    for chunk in chunks:
+        chunk = _start_stream(chunk, parts, title, status)
+        if chunk:
+            parts.append(chunk)
+            console.print(chunk, end="", style="green", markup=False, highlight=False)
+    if parts:
+        console.print()
+    return "".join(parts).strip()
+
+async def astream_to_console(chunks, title=None, status=None) -> str:
+    """Async counterpart of stream_to_console for async chunk iterators"""
+    parts = []
+    async for chunk in chunks:
+        chunk = _start_stream(chunk, parts, title, status)
+        if chunk:
+            parts.append(chunk)
+            console.print(chunk, end="", style="green", markup=False, highlight=False)
+    if parts:
+        console.print()
+    return "".join(parts).strip()
+
+def print_agent_output(node, state):
+    """Append the result of a finished agent to the transcript"""
+    if node not in AGENT_SECTIONS:
+        return
+    key, title = AGENT_SECTIONS[node]
+    if state.get(key):
+        console.print(f"\n{title}")
+        if key == "image_paths":
+            for path in state[key]:
+                console.print(f"Saved to: {path}")
+        else:
+            console.print(state[key], markup=False)
+
+def print_response(state):
+    """Append the assistant's reply to the transcript unless it was already streamed"""
+    messages = state.get("messages") or []
+    if messages and messages[-1]["role"] == "assistant" and not state.get("response_streamed"):
+        console.print("\n[bold green]Final Response:[/bold green]")
+        console.print(messages[-1]["content"], style="green", markup=False)
     
-    # Print the latest exchange with details
-    if messages:
-        latest_messages = messages[-2:] if len(messages) >= 2 else messages
-        
-        for message in latest_messages:
-            if message["role"] == "user":
-                console.print(f"\n[bold cyan]You:[/bold cyan]")
-                console.print(f"{message['content']}")
-            else:
-                if state.get("workflow_type") == "research":
-                    # Show research workflow output
-                    if state and state.get("research_results"):
-                        console.print("\n[bold magenta]Research Findings:[/bold magenta]")
-                        console.print(state["research_results"])
-                    
-                    if state and state.get("analysis_results"):
-                        console.print("\n[bold yellow]Analysis:[/bold yellow]")
-                        console.print(state["analysis_results"])
-                
-                elif state.get("workflow_type") == "image":
-                    # Show image generation workflow output
-                    if state and state.get("enhanced_prompt"):
-                        console.print("\n[bold magenta]Enhanced Prompt:[/bold magenta]")
-                        console.print(state["enhanced_prompt"])
-                    
-                    if state and state.get("image_path"):
-                        console.print("\n[bold yellow]Image Generated:[/bold yellow]")
-                        console.print(f"Saved to: {state['image_path']}")
-                
-                console.print("\n[bold green]Final Response:[/bold green]")
-                content = message["content"]
-                for char in content:
-                    console.print(char, end="", style="green")
-                    time.sleep(0.01)
-                console.print()
+    console.print("\n[blue]-------------------[/blue]")
+
+async def run_workflow(chain, state):
+    """Run a workflow, rendering each agent's output as soon as it finishes
+
+    Only the new exchange is printed; earlier turns stay on screen as they are.
+    """
+    result = state
+    async for step in chain.astream(state):
+        for node, output in step.items():
+            if isinstance(output, dict):
+                print_agent_output(node, output)
+                result = output
     
-    console.print("\n[blue]-------------------[/blue]") 
\ No newline at end of file
+    print_response(result)
+    return dict(result)
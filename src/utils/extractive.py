@@ -0,0 +1,104 @@
+import re
+from typing import List
+import numpy as np
+from .text import estimate_tokens, split_paragraphs, split_sentences
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Very common words carry no signal about which sentences matter
+STOPWORDS = frozenset("""
+a an and are as at be been but by can for from had has have he her his i if in into is it its
+may more not of on or our she so such than that the their them then there these they this to
+was we were what when which while who will with would you your
+""".split())
+
+
+def _sentence_term_matrix(sentences: List[str]):
+    """Build a row-normalized TF-IDF matrix in coordinate form"""
+    vocabulary = {}
+    rows, cols = [], []
+    for row, sentence in enumerate(sentences):
+        for word in _WORD.findall(sentence.lower()):
+            if word in STOPWORDS:
+                continue
+            rows.append(row)
+            cols.append(vocabulary.setdefault(word, len(vocabulary)))
+
+    num_sentences, num_terms = len(sentences), len(vocabulary)
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0), num_terms
+
+    # Collapse repeated (sentence, term) pairs into counts
+    pairs, counts = np.unique(
+        np.asarray(rows, dtype=np.int64) * num_terms + np.asarray(cols, dtype=np.int64),
+        return_counts=True,
+    )
+    rows, cols = pairs // num_terms, pairs % num_terms
+
+    document_frequency = np.bincount(cols, minlength=num_terms)
+    idf = np.log(num_sentences / document_frequency) + 1.0
+    values = (1.0 + np.log(counts)) * idf[cols]
+
+    # Normalize each sentence vector so dot products are cosine similarities
+    norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=num_sentences))
+    values = values / norms[rows]
+
+    return rows, cols, values, num_terms
+
+
+def rank_sentences(sentences: List[str], damping: float = 0.85, iterations: int = 50,
+                   tolerance: float = 1e-6) -> np.ndarray:
+    """Score sentences by LexRank centrality over their cosine similarity graph
+
+    The similarity matrix S = X X^T is never materialized: each power iteration
+    multiplies by X and X^T in sparse coordinate form, so the cost grows with
+    the number of words rather than with the square of the number of sentences.
+    """
+    num_sentences = len(sentences)
+    if num_sentences == 0:
+        return np.empty(0)
+
+    rows, cols, values, num_terms = _sentence_term_matrix(sentences)
+    if len(values) == 0:
+        return np.full(num_sentences, 1.0 / num_sentences)
+
+    # Each sentence is perfectly similar to itself; leave those loops out
+    self_similarity = np.bincount(rows, weights=values ** 2, minlength=num_sentences)
+
+    def similarity_times(vector):
+        # S @ vector computed as X @ (X^T @ vector)
+        term_weights = np.bincount(cols, weights=values * vector[rows], minlength=num_terms)
+        product = np.bincount(rows, weights=values * term_weights[cols], minlength=num_sentences)
+        return product - self_similarity * vector
+
+    degree = similarity_times(np.ones(num_sentences))
+    degree[degree <= 1e-12] = 1.0
+
+    scores = np.full(num_sentences, 1.0 / num_sentences)
+    for _ in range(iterations):
+        updated = (1 - damping) / num_sentences + damping * similarity_times(scores / degree)
+        if np.abs(updated - scores).sum() < tolerance:
+            scores = updated
+            break
+        scores = updated
+
+    return scores
+
+
+def extract_key_sentences(text: str, token_budget: int) -> str:
+    """Keep the highest-ranked sentences that fit in token_budget, in original order"""
+    if estimate_tokens(text) <= token_budget:
+        return text
+
+    sentences = [sentence for paragraph in split_paragraphs(text) for sentence in split_sentences(paragraph)]
+    scores = rank_sentences(sentences)
+
+    selected, used = [], 0
+    for index in np.argsort(-scores, kind="stable"):
+        cost = estimate_tokens(sentences[index]) + 1
+        if used + cost > token_budget:
+            continue
+        selected.append(index)
+        used += cost
+
+    return " ".join(sentences[index] for index in sorted(selected))
@@ -0,0 +1,109 @@
+import re
+from typing import Dict, List, Tuple
+
+# Common misspellings and their corrections
+MISSPELLINGS = {
+    "accomodate": "accommodate", "acheive": "achieve", "adress": "address", "alot": "a lot",
+    "apparantly": "apparently", "arguement": "argument", "basicly": "basically",
+    "beleive": "believe", "begining": "beginning", "calender": "calendar",
+    "commited": "committed", "definately": "definitely", "dissapoint": "disappoint",
+    "embarass": "embarrass", "enviroment": "environment", "existance": "existence",
+    "familar": "familiar", "finaly": "finally", "foriegn": "foreign", "goverment": "government",
+    "grammer": "grammar", "happend": "happened", "immediatly": "immediately",
+    "independant": "independent", "occured": "occurred", "occurence": "occurrence",
+    "persistant": "persistent", "posession": "possession", "prefered": "preferred",
+    "publically": "publicly", "realy": "really", "recieve": "receive",
+    "recomend": "recommend", "seperate": "separate", "succesful": "successful",
+    "suprise": "surprise", "teh": "the", "tommorow": "tomorrow", "tomorow": "tomorrow",
+    "truely": "truly", "untill": "until", "wich": "which", "writting": "writing",
+}
+
+_MISSPELLING = re.compile(r"\b(" + "|".join(map(re.escape, MISSPELLINGS)) + r")\b", re.IGNORECASE)
+
+
+def _match_case(original: str, replacement: str) -> str:
+    if original.isupper() and len(original) > 1:
+        return replacement.upper()
+    if original[0].isupper():
+        return replacement[0].upper() + replacement[1:]
+    return replacement
+
+
+# Words that follow the pronoun "i", so a lone "i" in commands like "npm i" is left alone
+_I_FOLLOWERS = (
+    "am|was|have|had|will|would|can|can't|cannot|could|couldn't|should|shall|must|might|may|"
+    "do|don't|did|didn't|think|thought|know|knew|want|wanted|need|needed|like|liked|love|loved|"
+    "hate|feel|felt|believe|guess|hope|see|saw|say|said|go|went|got|get|just|really|also|never|"
+    "always|still|mean|meant|wish|agree|remember|understand|tried|try|made|make|found|use|used|"
+    "told|asked"
+)
+
+# Rules that can be fixed automatically: (name, pattern, replacement, message)
+# Capitalization runs before the spacing rules so it never acts on text the engine changed itself
+FIX_RULES = [
+    ("misspelling", _MISSPELLING,
+     lambda m: _match_case(m.group(0), MISSPELLINGS[m.group(0).lower()]), "Common misspelling"),
+    # "that that" and "had had" are often correct
+    ("doubled_word", re.compile(r"\b(?!(?:that|had)\b)(\w+)(\s+)\1\b", re.IGNORECASE),
+     lambda m: m.group(1), "Repeated word"),
+    ("lowercase_i", re.compile(r"\bi(?=\s+(?:" + _I_FOLLOWERS + r")\b|['’](?:m|ve|ll|d)\b)"),
+     lambda m: "I", "The pronoun 'I' is always capitalized"),
+    # Abbreviations like "i.e.", words like URLs and detached marks like "the ? operator" are left alone
+    ("sentence_start_lowercase", re.compile(r"(^|(?<!\.[a-z])(?<=\S)[.!?][\"')\]]*\s+)([a-z])(?![\w-]*[./]\w)"),
+     lambda m: m.group(1) + m.group(2).upper(), "Sentence should start with a capital letter"),
+    # Only marks that end a word, so ".env" or ".NET" are not touched; "a ,b" becomes "a, b"
+    ("space_before_punctuation", re.compile(r"[ \t]+(?:([,.;:!?])(?=\s|$)|([,;:])(?=\S))"),
+     lambda m: m.group(1) or m.group(2) + " ", "Extra space before punctuation"),
+    ("missing_space_after_punctuation", re.compile(r"([,;!?])(?=[A-Za-z])|(?<=[a-z])\.(?=[A-Z][a-z])"),
+     lambda m: (m.group(1) or ".") + " ", "Missing space after punctuation"),
+    ("multiple_spaces", re.compile(r"(?<=\S)[ \t]{2,}(?=\S)"),
+     lambda m: " ", "Multiple spaces"),
+]
+
+# Patterns that usually signal a mistake but need a human or model to fix
+FLAG_RULES = [
+    ("could_of", re.compile(r"\b(could|should|would|must|might) of\b", re.IGNORECASE),
+     "Use 'have' instead of 'of' after a modal verb"),
+    ("subject_verb_agreement", re.compile(
+        r"\b(he|she|it) (don't|were|have been|are)\b|\b(they|we|you) (was|wasn't|doesn't|is)\b",
+        re.IGNORECASE),
+     "Possible subject-verb agreement error"),
+    ("its_its", re.compile(r"\bits (a|an|the|been|not|going)\b", re.IGNORECASE),
+     "Possible confusion between 'its' and 'it's'"),
+    ("your_youre", re.compile(r"\byour (welcome|going|not|being)\b", re.IGNORECASE),
+     "Possible confusion between 'your' and 'you're'"),
+    ("then_than", re.compile(r"\b(more|less|better|worse|rather|other) then\b", re.IGNORECASE),
+     "Possible confusion between 'then' and 'than'"),
+]
+
+
+def apply_rules(text: str) -> Tuple[str, List[Dict], List[Dict]]:
+    """Run the local rule engine over a paragraph
+
+    Returns the corrected text, the issues that were fixed automatically and
+    the issues that were only flagged for review.
+    """
+    fixes = []
+    for name, pattern, replacement, message in FIX_RULES:
+        def replace(match):
+            suggestion = replacement(match)
+            if suggestion != match.group(0):
+                fixes.append({"rule": name, "message": message, "original": match.group(0), "suggestion": suggestion})
+            return suggestion
+
+        text = pattern.sub(replace, text)
+
+    flags = [
+        {"rule": name, "message": message, "original": match.group(0)}
+        for name, pattern, message in FLAG_RULES
+        for match in pattern.finditer(text)
+    ]
+
+    return text, fixes, flags
+
+
+def format_issues(fixes: List[Dict], flags: List[Dict]) -> str:
+    """Describe rule engine findings as a short bulleted list"""
+    lines = [f"- {fix['message']}: '{fix['original']}' → '{fix['suggestion']}'" for fix in fixes]
+    lines += [f"- {flag['message']}: '{flag['original']}'" for flag in flags]
+    return "\n".join(lines)
@@ -0,0 +1,62 @@
+from collections import deque
+from typing import Dict, Iterable, List
+from .text import estimate_tokens
+from .extractive import extract_key_sentences
+
+
+class ConversationHistory:
+    """Chat history held within a token budget
+
+    Recent messages are kept verbatim in a deque. When they no longer fit in
+    the budget the oldest ones are folded into a rolling summary, which is
+    itself trimmed to summary_tokens with the local extractive summarizer, so
+    the memory used by a session stays flat however long it runs.
+    """
+
+    def __init__(self, token_budget: int = 4000, summary_tokens: int = 500, min_recent_messages: int = 2):
+        self.token_budget = token_budget
+        self.summary_tokens = summary_tokens
+        self.min_recent_messages = min_recent_messages
+        self.messages = deque()
+        self.summary = ""
+        self._tokens = 0
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def append(self, message: Dict):
+        """Add a message, compacting older ones if the budget is exceeded"""
+        self.messages.append(message)
+        self._tokens += estimate_tokens(message["content"])
+        self._compact()
+
+    def extend(self, messages: Iterable[Dict]):
+        for message in messages:
+            self.append(message)
+
+    def clear(self):
+        self.messages.clear()
+        self.summary = ""
+        self._tokens = 0
+
+    def _compact(self):
+        folded = []
+        while self._tokens > self.token_budget and len(self.messages) > self.min_recent_messages:
+            message = self.messages.popleft()
+            self._tokens -= estimate_tokens(message["content"])
+            speaker = "User" if message["role"] == "user" else "Assistant"
+            folded.append(f"{speaker}: {message['content'].strip()}")
+
+        if folded:
+            summary = "\n\n".join(([self.summary] if self.summary else []) + folded)
+            self.summary = extract_key_sentences(summary, self.summary_tokens)
+
+    def as_messages(self) -> List[Dict]:
+        """Messages for a new workflow run, led by the summary of older turns"""
+        messages = list(self.messages)
+        if self.summary:
+            messages.insert(0, {
+                "role": "system",
+                "content": f"Summary of the earlier conversation:\n{self.summary}"
+            })
+        return messages
@@ -0,0 +1,37 @@
+from typing import Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(max_retries: int = 3, backoff_factor: float = 1.0, pool_size: int = 4,
+                   retry_statuses: Tuple[int, ...] = RETRY_STATUS_CODES) -> requests.Session:
+    """Build a pooled session that keeps connections alive and retries transient failures
+
+    Retries back off exponentially (backoff_factor * 2 ** attempt seconds) and
+    wait for the server's Retry-After header when one is sent. Requests are
+    never retried after a read error: the server may already have done (and
+    billed) the work, so only failed connections and retryable status codes
+    are sent again. Callers that handle rate limiting themselves can leave
+    429 out of retry_statuses to see it straight away.
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_statuses,
+        allowed_methods=None,  # POST requests are retried too
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,115 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from PIL import Image
+from .console import console
+
+# File extension and Pillow format for each supported derivative
+FORMATS = {
+    "webp": (".webp", "WEBP"),
+    "jpeg": (".jpg", "JPEG"),
+}
+
+THUMBNAIL_EXT = ".thumb.jpg"
+
+
+def _save(image: Image.Image, path: str, pillow_format: str, quality: int):
+    # JPEG has no alpha channel
+    if pillow_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    tmp_path = path + ".tmp"
+    image.save(tmp_path, pillow_format, quality=quality)
+    os.replace(tmp_path, path)
+
+
+def make_derivatives(path: str, thumbnail_size: int, formats: List[str], quality: int) -> Dict[str, str]:
+    """Write a thumbnail and converted copies next to an image
+
+    Runs in a worker process. Returns the paths written, keyed by "thumbnail"
+    or the format name. The original is left in place; dropping it is up to
+    the pipeline once the index points at the converted copy.
+    """
+    stem, _ = os.path.splitext(path)
+    written = {}
+
+    with Image.open(path) as image:
+        image.load()
+        for name in formats:
+            ext, pillow_format = FORMATS[name]
+            written[name] = stem + ext
+            _save(image, written[name], pillow_format, quality)
+
+        if thumbnail_size:
+            thumbnail = image.copy()
+            thumbnail.thumbnail((thumbnail_size, thumbnail_size))
+            written["thumbnail"] = stem + THUMBNAIL_EXT
+            _save(thumbnail, written["thumbnail"], "JPEG", quality)
+
+    return written
+
+
+class DerivativePipeline:
+    """Produces image derivatives in a background process pool
+
+    Submitting never blocks. When the original is dropped, callers are given
+    the path of the first converted format up front (see final_record), and
+    the original is only deleted after that copy exists and the image store
+    points at it, so one of the two files is always there.
+    """
+
+    def __init__(self, store, thumbnail_size: int = 256, formats: Iterable[str] = (),
+                 quality: int = 85, keep_original: bool = True, max_workers: int = 2):
+        self.store = store
+        self.thumbnail_size = thumbnail_size
+        self.formats = [name for name in formats if name in FORMATS]
+        self.quality = quality
+        self.keep_original = keep_original or not self.formats
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.thumbnail_size or self.formats)
+
+    def final_record(self, record: Dict) -> Dict:
+        """The record as it will look once the derivatives are done"""
+        if self.keep_original or not self.enabled:
+            return record
+        stem, _ = os.path.splitext(record["path"])
+        return {**record, "path": stem + FORMATS[self.formats[0]][0]}
+
+    def submit(self, records: Iterable[Dict]):
+        """Queue derivatives for freshly saved images"""
+        if not self.enabled:
+            return
+
+        if self._executor is None:
+            # Forking from a threaded process with open SQLite connections can deadlock
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+        for digest, path in {record["hash"]: record["path"] for record in records}.items():
+            future = self._executor.submit(
+                make_derivatives, path, self.thumbnail_size, self.formats, self.quality
+            )
+            future.add_done_callback(lambda future, digest=digest, path=path: self._finished(digest, path, future))
+
+    def _finished(self, digest: str, path: str, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            console.print(f"\n[yellow]Warning: could not create thumbnails or conversions for {path}: {error}[/yellow]")
+            return
+        if not self.keep_original:
+            self.store.set_ext(digest, FORMATS[self.formats[0]][0])
+            if os.path.exists(path):
+                os.remove(path)
+
+    def shutdown(self, wait: bool = True):
+        """Wait for queued derivatives and stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
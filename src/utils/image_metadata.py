@@ -0,0 +1,116 @@
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+_QUERY_WORD = re.compile(r"\w+")
+
+
+class ImageMetadataIndex:
+    """Searchable SQLite index of generated image metadata
+
+    One row per stored image, with B-tree indexes for the style, size and date
+    filters and an FTS5 table over the prompts. Searching never opens the
+    image files themselves.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        # Create the index directory if it doesn't exist
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS images (
+                    seq INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    prompt TEXT NOT NULL,
+                    style TEXT,
+                    width INTEGER,
+                    height INTEGER,
+                    samples INTEGER,
+                    steps INTEGER,
+                    seed INTEGER,
+                    created_at TEXT NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_images_style ON images (style COLLATE NOCASE)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_images_size ON images (width, height)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_images_created ON images (created_at)")
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS image_prompts USING fts5(prompt, content='images', content_rowid='seq')"
+            )
+            self._conn.commit()
+
+    def add(self, metadata: Dict):
+        """Index every image described by a state["image_metadata"] dict"""
+        settings = metadata.get("settings", {})
+        prompt = metadata["prompt"]
+        created_at = metadata.get("timestamp") or datetime.now().isoformat()
+
+        with self._lock:
+            for record in metadata.get("images", []):
+                cursor = self._conn.execute(
+                    """INSERT OR IGNORE INTO images
+                    (seq, name, hash, prompt, style, width, height, samples, steps, seed, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (record["seq"], record["name"], record["hash"], prompt, metadata.get("style"),
+                     settings.get("width"), settings.get("height"), settings.get("samples"),
+                     settings.get("steps"), record.get("seed") or settings.get("seed"), created_at)
+                )
+                if cursor.rowcount:
+                    self._conn.execute(
+                        "INSERT INTO image_prompts (rowid, prompt) VALUES (?, ?)", (record["seq"], prompt)
+                    )
+            self._conn.commit()
+
+    def search(self, query: Optional[str] = None, style: Optional[str] = None,
+               width: Optional[int] = None, height: Optional[int] = None,
+               since: Optional[str] = None, until: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """Find images by prompt words and filters, newest first
+
+        Every word of the query must appear in the prompt (prefix matches are
+        allowed). Dates are ISO strings such as 2024-05-01.
+        """
+        clauses, params = [], []
+        if query:
+            words = _QUERY_WORD.findall(query)
+            if words:
+                clauses.append("seq IN (SELECT rowid FROM image_prompts WHERE image_prompts MATCH ?)")
+                params.append(" ".join(f'"{word}"*' for word in words))
+        if style:
+            clauses.append("style = ? COLLATE NOCASE")
+            params.append(style)
+        if width:
+            clauses.append("width = ?")
+            params.append(width)
+        if height:
+            clauses.append("height = ?")
+            params.append(height)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until:
+            # Include the whole of the final day
+            clauses.append("created_at < date(?, '+1 day')")
+            params.append(until)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT seq, name, hash, prompt, style, width, height, seed, created_at
+                FROM images {where} ORDER BY created_at DESC, seq DESC LIMIT ?""",
+                (*params, limit)
+            ).fetchall()
+
+        columns = ("seq", "name", "hash", "prompt", "style", "width", "height", "seed", "created_at")
+        return [dict(zip(columns, row)) for row in rows]
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+class ImageStore:
+    """Content-addressed image files with a small SQLite index
+
+    Images are stored under objects/<aa>/<bb>/<sha256><ext>, written to a
+    temporary file first and renamed into place, so concurrent writers never
+    see partial files and identical images are kept once. The index maps
+    sequence numbers and friendly names (image_1, image_2, ... unless a name
+    is given) to the hashes.
+
+    It also remembers which images each API request produced, so an identical
+    request can be answered from disk (at most cache_max_entries requests,
+    least recently used evicted first; the images themselves are kept).
+    """
+
+    def __init__(self, root: str = "generated_images", cache_max_entries: int = 500):
+        self.root = root
+        self.cache_max_entries = cache_max_entries
+        self.hits = 0
+        self.misses = 0
+        self.objects_dir = os.path.join(root, "objects")
+        self.tmp_dir = os.path.join(root, "tmp")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, "index.sqlite3"), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS images (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE,
+                    hash TEXT NOT NULL,
+                    ext TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_images_hash ON images (hash)")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS generations (
+                    key TEXT PRIMARY KEY,
+                    seqs TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_generations_accessed ON generations (accessed_at)"
+            )
+            self._conn.commit()
+
+    def path_for(self, digest: str, ext: str = ".png") -> str:
+        """Location of an object, sharded by the first two bytes of its hash"""
+        return os.path.join(self.objects_dir, digest[:2], digest[2:4], digest + ext)
+
+    def save(self, chunks: Iterable[bytes], name: Optional[str] = None, ext: str = ".png") -> Dict:
+        """Write an image from a stream of byte chunks and register it in the index"""
+        sha = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir, suffix=ext)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    sha.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+
+            os.chmod(tmp_path, 0o644)
+            digest = sha.hexdigest()
+            path = self.path_for(digest, ext)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Atomic on the same filesystem; an identical image simply replaces itself
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO images (name, hash, ext, size, created_at) VALUES (?, ?, ?, ?, ?)",
+                (name, digest, ext, size, time.time())
+            )
+            seq = cursor.lastrowid
+            if name is None:
+                name = f"image_{seq}"
+                self._conn.execute("UPDATE images SET name = ? WHERE seq = ?", (name, seq))
+            self._conn.commit()
+
+        return {"seq": seq, "name": name, "hash": digest, "path": path, "size": size}
+
+    def get(self, ref) -> Optional[Dict]:
+        """Look up an image by sequence number, friendly name or hash"""
+        with self._lock:
+            if isinstance(ref, int) or str(ref).isdigit():
+                row = self._conn.execute(
+                    "SELECT seq, name, hash, ext, size FROM images WHERE seq = ?", (int(ref),)
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT seq, name, hash, ext, size FROM images WHERE name = ? OR hash = ? LIMIT 1",
+                    (ref, ref)
+                ).fetchone()
+        return self._record(row) if row else None
+
+    def set_ext(self, digest: str, ext: str):
+        """Point every entry for a hash at a converted file, e.g. after the PNG was dropped"""
+        with self._lock:
+            self._conn.execute("UPDATE images SET ext = ? WHERE hash = ?", (ext, digest))
+            self._conn.commit()
+
+    @staticmethod
+    def request_key(request: Dict) -> str:
+        """Stable key for an API request body"""
+        payload = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cached_generation(self, request: Dict) -> Optional[List[Dict]]:
+        """Images already produced by an identical request, or None on a miss"""
+        key = self.request_key(request)
+        with self._lock:
+            row = self._conn.execute("SELECT seqs FROM generations WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            seqs = json.loads(row[0])
+            rows = self._conn.execute(
+                f"SELECT seq, name, hash, ext, size FROM images WHERE seq IN ({','.join('?' * len(seqs))}) ORDER BY seq",
+                seqs
+            ).fetchall()
+            records = [self._record(row) for row in rows]
+
+            # Entries whose files were deleted by hand are dropped
+            if len(records) != len(seqs) or not all(os.path.exists(record["path"]) for record in records):
+                self._conn.execute("DELETE FROM generations WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE generations SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.hits += 1
+            return records
+
+    def remember_generation(self, request: Dict, records: List[Dict]):
+        """Record the images a request produced, evicting the least recently used entries"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO generations (key, seqs, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (self.request_key(request), json.dumps([record["seq"] for record in records]), now, now)
+            )
+            if self.cache_max_entries:
+                self._conn.execute(
+                    """DELETE FROM generations WHERE key IN (
+                        SELECT key FROM generations ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )""",
+                    (self.cache_max_entries,)
+                )
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Return request cache counters and the number of stored images"""
+        with self._lock:
+            images = self._conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+            cached = self._conn.execute("SELECT COUNT(*) FROM generations").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_requests": cached,
+            "images": images,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _record(self, row) -> Dict:
+        seq, name, digest, ext, size = row
+        return {"seq": seq, "name": name, "hash": digest, "path": self.path_for(digest, ext), "size": size}
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobQueue:
+    """Durable local work queue backed by SQLite
+
+    Jobs belong to a named batch and are identified by a hash of their
+    payload, so enqueueing the same file twice does not duplicate work.
+    Jobs left running by a crashed process are put back with
+    requeue_interrupted() when the runner starts again.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        # Create the queue directory if it doesn't exist
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY,
+                    batch TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    not_before REAL NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    updated_at REAL NOT NULL,
+                    UNIQUE (batch, key)
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (batch, status, id)")
+            self._conn.commit()
+
+    @staticmethod
+    def job_key(payload: Dict) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def enqueue(self, batch: str, payloads: Iterable[Dict]) -> int:
+        """Add jobs to a batch, skipping ones it already has; returns how many were added"""
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                """INSERT OR IGNORE INTO jobs (batch, key, payload, status, updated_at)
+                VALUES (?, ?, ?, ?, ?)""",
+                [(batch, self.job_key(payload), json.dumps(payload), PENDING, now) for payload in payloads]
+            )
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def requeue_interrupted(self, batch: str) -> int:
+        """Put jobs that were running when the process stopped back in the queue"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE batch = ? AND status = ?",
+                (PENDING, time.time(), batch, RUNNING)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def retry_failed(self, batch: str) -> int:
+        """Give failed jobs another chance"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, error = NULL, updated_at = ? WHERE batch = ? AND status = ?",
+                (PENDING, time.time(), batch, FAILED)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def claim(self, batch: str) -> Optional[Dict]:
+        """Mark the next ready job as running and return it, or None if none is ready"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT id, payload, attempts FROM jobs
+                WHERE batch = ? AND status = ? AND not_before <= ?
+                ORDER BY id LIMIT 1""",
+                (batch, PENDING, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            job_id, payload, attempts = row
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = ?, updated_at = ? WHERE id = ?",
+                (RUNNING, attempts + 1, now, job_id)
+            )
+            self._conn.commit()
+        return {"id": job_id, "payload": json.loads(payload), "attempts": attempts + 1}
+
+    def complete(self, job_id: int, result: Dict):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, updated_at = ? WHERE id = ?",
+                (DONE, json.dumps(result, default=str), time.time(), job_id)
+            )
+            self._conn.commit()
+
+    def fail(self, job_id: int, error: str, retry_in: Optional[float] = None, count_attempt: bool = True):
+        """Record a failure, putting the job back in the queue when retry_in is given
+
+        With count_attempt=False the claim that led to the failure is given
+        back, e.g. when the API only asked to slow down.
+        """
+        now = time.time()
+        with self._lock:
+            if not count_attempt:
+                self._conn.execute("UPDATE jobs SET attempts = MAX(attempts - 1, 0) WHERE id = ?", (job_id,))
+            if retry_in is None:
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                    (FAILED, error, now, job_id)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, not_before = ?, updated_at = ? WHERE id = ?",
+                    (PENDING, error, now + retry_in, now, job_id)
+                )
+            self._conn.commit()
+
+    def counts(self, batch: str) -> Dict[str, int]:
+        """Number of jobs in the batch per status"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs WHERE batch = ? GROUP BY status", (batch,)
+            ).fetchall()
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
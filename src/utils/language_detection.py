@@ -0,0 +1,110 @@
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from .language_profiles import LANGUAGE_SAMPLES, SCRIPT_LANGUAGES, SCRIPT_VARIANTS
+
+# Character n-gram sizes used in the profiles
+NGRAM_SIZES = (2, 3)
+
+# Number of most frequent n-grams kept per language profile
+PROFILE_SIZE = 400
+
+# Texts that match no profile at least this well are in a language without one;
+# the margin between two wrong profiles says nothing then
+MIN_SIMILARITY = 0.3
+
+_NON_LETTERS = re.compile(r"[^\w]+|[\d_]+")
+
+
+def _ngram_counts(text: str) -> Counter:
+    """Count padded character n-grams of every word in the text"""
+    counts = Counter()
+    for word in _NON_LETTERS.sub(" ", text.lower()).split():
+        padded = f" {word} "
+        for size in NGRAM_SIZES:
+            for i in range(len(padded) - size + 1):
+                counts[padded[i:i + size]] += 1
+    return counts
+
+
+def _normalize(counts) -> Dict[str, float]:
+    norm = math.sqrt(sum(value * value for value in counts.values())) or 1.0
+    return {gram: value / norm for gram, value in counts.items()}
+
+
+def _build_profiles() -> Dict[str, Dict[str, float]]:
+    profiles = {}
+    for language, sample in LANGUAGE_SAMPLES.items():
+        counts = _ngram_counts(sample)
+        profiles[language] = _normalize(dict(counts.most_common(PROFILE_SIZE)))
+    return profiles
+
+
+_PROFILES = _build_profiles()
+
+
+def _in_ranges(char: str, ranges) -> bool:
+    code = ord(char)
+    return any(low <= code <= high for low, high in ranges)
+
+
+def _detect_script(letters: str) -> Tuple[Optional[str], float]:
+    """Recognise languages that have a writing system of their own"""
+    counts = Counter()
+    for char in letters:
+        for language, ranges in SCRIPT_LANGUAGES:
+            if _in_ranges(char, ranges):
+                counts[language] += 1
+                break
+
+    # Japanese mixes kana with Chinese characters
+    if counts["Japanese"]:
+        counts["Japanese"] += counts.pop("Chinese", 0)
+
+    if not counts:
+        return None, 0.0
+
+    language, count = counts.most_common(1)[0]
+    share = count / len(letters)
+    if share < 0.5:
+        return None, 0.0
+
+    if language in SCRIPT_VARIANTS:
+        variant, markers = SCRIPT_VARIANTS[language]
+        if any(char in markers for char in letters):
+            language = variant
+
+    return language, share
+
+
+@lru_cache(maxsize=1024)
+def detect_language(text: str) -> Tuple[Optional[str], float]:
+    """Detect the language of a text locally
+
+    Returns (language, confidence) where confidence is between 0 and 1. For
+    languages written in Latin script the confidence is the relative margin
+    between the best and second-best profile match, so it is low whenever two
+    languages fit about equally well, and zero when no profile fits well enough
+    (see MIN_SIMILARITY).
+    """
+    letters = "".join(char for char in text if char.isalpha())
+    if not letters:
+        return None, 0.0
+
+    language, confidence = _detect_script(letters)
+    if language:
+        return language, confidence
+
+    counts = _normalize(_ngram_counts(text))
+    scores = sorted(
+        (sum(weight * profile.get(gram, 0.0) for gram, weight in counts.items()), language)
+        for language, profile in _PROFILES.items()
+    )
+    best_score, best_language = scores[-1]
+    second_score = scores[-2][0] if len(scores) > 1 else 0.0
+    if best_score < MIN_SIMILARITY:
+        return None, 0.0
+
+    return best_language, (best_score - second_score) / best_score
@@ -0,0 +1,312 @@
+# Reference text for the character n-gram language profiles. Each sample is
+# ordinary prose with the common function words of its language; profiles are
+# built from these once at import time.
+LANGUAGE_SAMPLES = {
+    "English": """
+        The weather was cold this morning, so we stayed at home and read the newspaper.
+        My brother wants to know when the next train leaves for the city. I think that
+        it is important to spend time with your family and friends. Where did you put
+        the keys? They should be on the table in the kitchen. We have been working on
+        this project for a long time, and we are happy with the results. Could you
+        please tell me how much this costs? The children were playing in the garden
+        while their parents prepared dinner. What would you like to do this weekend?
+        Thank you very much for your help, and have a nice day.
+        The new version of the application was released last week after several months of
+        testing. Most of the changes are small, but users should notice that the program
+        starts faster and uses less memory than before. If you have any questions about the
+        update, you can write to our support team, which answers every message within two
+        working days. We would also like to thank everyone who reported problems and helped
+        us to find their causes. According to the report, the number of visitors to the
+        museum has grown every year since it opened, and the city is now planning to build a
+        second entrance. Nobody knows yet how long the work will take or how much it will
+        cost, because the old building has to stay open during the whole project.
+    """,
+    "Spanish": """
+        El tiempo estaba frío esta mañana, así que nos quedamos en casa y leímos el
+        periódico. Mi hermano quiere saber cuándo sale el próximo tren para la ciudad.
+        Creo que es importante pasar tiempo con la familia y los amigos. ¿Dónde pusiste
+        las llaves? Deberían estar en la mesa de la cocina. Hemos trabajado en este
+        proyecto durante mucho tiempo y estamos contentos con los resultados. ¿Podría
+        decirme cuánto cuesta esto? Los niños jugaban en el jardín mientras sus padres
+        preparaban la cena. ¿Qué te gustaría hacer este fin de semana? Muchas gracias
+        por tu ayuda, y que tengas un buen día.
+        La nueva versión de la aplicación se publicó la semana pasada después de varios meses
+        de pruebas. La mayoría de los cambios son pequeños, pero los usuarios notarán que el
+        programa arranca más rápido y usa menos memoria que antes. Si tiene alguna pregunta
+        sobre la actualización, puede escribir a nuestro equipo de soporte, que responde a
+        todos los mensajes en dos días hábiles. También queremos dar las gracias a todos los
+        que nos informaron de los problemas y nos ayudaron a encontrar sus causas. Según el
+        informe, el número de visitantes del museo ha crecido cada año desde que se abrió, y
+        el ayuntamiento ya está planeando construir una segunda entrada. Todavía nadie sabe
+        cuánto tiempo durarán las obras ni cuánto van a costar, porque el edificio tiene que
+        seguir abierto durante todo el proyecto.
+    """,
+    "French": """
+        Il faisait froid ce matin, alors nous sommes restés à la maison et nous avons lu
+        le journal. Mon frère veut savoir quand part le prochain train pour la ville. Je
+        pense qu'il est important de passer du temps avec sa famille et ses amis. Où as-tu
+        mis les clés ? Elles devraient être sur la table de la cuisine. Nous travaillons
+        sur ce projet depuis longtemps et nous sommes contents des résultats. Pourriez-vous
+        me dire combien cela coûte ? Les enfants jouaient dans le jardin pendant que leurs
+        parents préparaient le dîner. Qu'est-ce que tu aimerais faire ce week-end ? Merci
+        beaucoup pour votre aide, et bonne journée.
+        La nouvelle version de l'application est sortie la semaine dernière après plusieurs
+        mois de tests. La plupart des changements sont mineurs, mais les utilisateurs vont
+        remarquer que le programme démarre plus vite et utilise moins de mémoire qu'avant.
+        Si vous avez des questions sur la mise à jour, vous pouvez écrire à notre équipe
+        d'assistance, qui répond à tous les messages en deux jours ouvrables. Nous voulons
+        aussi remercier tous ceux qui nous ont signalé des problèmes et nous ont aidés à en
+        trouver les causes. Selon le rapport, le nombre de visiteurs du musée a augmenté
+        chaque année depuis son ouverture, et la mairie prévoit maintenant de construire une
+        deuxième entrée. Personne ne sait encore combien de temps dureront les travaux ni
+        combien ils vont coûter, parce que le bâtiment doit rester ouvert pendant tout le
+        projet.
+    """,
+    "German": """
+        Heute Morgen war es kalt, deshalb sind wir zu Hause geblieben und haben die Zeitung
+        gelesen. Mein Bruder möchte wissen, wann der nächste Zug in die Stadt fährt. Ich
+        glaube, dass es wichtig ist, Zeit mit der Familie und den Freunden zu verbringen.
+        Wo hast du die Schlüssel hingelegt? Sie sollten auf dem Tisch in der Küche liegen.
+        Wir arbeiten schon seit langer Zeit an diesem Projekt und sind mit den Ergebnissen
+        zufrieden. Könnten Sie mir bitte sagen, wie viel das kostet? Die Kinder spielten im
+        Garten, während ihre Eltern das Abendessen vorbereiteten. Was möchtest du am
+        Wochenende machen? Vielen Dank für deine Hilfe und einen schönen Tag noch.
+        Die neue Version der Anwendung ist letzte Woche nach mehreren Monaten der Tests
+        erschienen. Die meisten Änderungen sind klein, aber die Benutzer werden merken, dass
+        das Programm schneller startet und weniger Speicher braucht als vorher. Wenn Sie
+        Fragen zu dem Update haben, können Sie unserem Support schreiben, der jede Nachricht
+        innerhalb von zwei Werktagen beantwortet. Außerdem möchten wir uns bei allen bedanken,
+        die uns Probleme gemeldet und uns geholfen haben, ihre Ursachen zu finden. Laut dem
+        Bericht ist die Zahl der Besucher des Museums seit der Eröffnung jedes Jahr
+        gestiegen, und die Stadt plant jetzt, einen zweiten Eingang zu bauen. Noch weiß
+        niemand, wie lange die Arbeiten dauern werden oder wie viel sie kosten, weil das alte
+        Gebäude während des ganzen Projekts geöffnet bleiben muss.
+    """,
+    "Italian": """
+        Stamattina faceva freddo, quindi siamo rimasti a casa e abbiamo letto il giornale.
+        Mio fratello vuole sapere quando parte il prossimo treno per la città. Penso che sia
+        importante passare del tempo con la famiglia e gli amici. Dove hai messo le chiavi?
+        Dovrebbero essere sul tavolo della cucina. Lavoriamo a questo progetto da molto
+        tempo e siamo contenti dei risultati. Potrebbe dirmi quanto costa questo? I bambini
+        giocavano nel giardino mentre i loro genitori preparavano la cena. Che cosa ti
+        piacerebbe fare questo fine settimana? Grazie mille per il tuo aiuto, e buona
+        giornata.
+        La nuova versione dell'applicazione è uscita la settimana scorsa dopo diversi mesi di
+        prove. La maggior parte delle modifiche è piccola, ma gli utenti noteranno che il
+        programma si avvia più velocemente e usa meno memoria di prima. Se avete domande
+        sull'aggiornamento, potete scrivere al nostro servizio di assistenza, che risponde a
+        tutti i messaggi entro due giorni lavorativi. Vogliamo anche ringraziare tutti quelli
+        che ci hanno segnalato i problemi e ci hanno aiutato a trovarne le cause. Secondo il
+        rapporto, il numero dei visitatori del museo è cresciuto ogni anno dalla sua apertura,
+        e il comune sta ora pensando di costruire un secondo ingresso. Nessuno sa ancora
+        quanto dureranno i lavori né quanto costeranno, perché il vecchio edificio deve
+        restare aperto durante tutto il progetto.
+    """,
+    "Portuguese": """
+        Estava frio hoje de manhã, então ficamos em casa e lemos o jornal. O meu irmão quer
+        saber quando sai o próximo comboio para a cidade. Acho que é importante passar tempo
+        com a família e com os amigos. Onde você colocou as chaves? Elas deveriam estar na
+        mesa da cozinha. Nós trabalhamos neste projeto há muito tempo e estamos satisfeitos
+        com os resultados. Você poderia me dizer quanto custa isso? As crianças brincavam no
+        jardim enquanto os pais preparavam o jantar. O que você gostaria de fazer neste fim
+        de semana? Muito obrigado pela sua ajuda, e tenha um bom dia.
+        A nova versão do aplicativo foi lançada na semana passada depois de vários meses de
+        testes. A maioria das mudanças é pequena, mas os usuários vão perceber que o programa
+        inicia mais rápido e usa menos memória do que antes. Se você tiver alguma dúvida sobre
+        a atualização, pode escrever para a nossa equipe de suporte, que responde a todas as
+        mensagens em até dois dias úteis. Também queremos agradecer a todos que nos avisaram
+        dos problemas e nos ajudaram a encontrar as suas causas. De acordo com o relatório, o
+        número de visitantes do museu cresceu todos os anos desde a sua inauguração, e a
+        prefeitura agora planeja construir uma segunda entrada. Ainda ninguém sabe quanto
+        tempo as obras vão durar nem quanto vão custar, porque o prédio antigo precisa
+        continuar aberto durante todo o projeto. Não há motivo para preocupação.
+    """,
+    "Dutch": """
+        Het was koud vanochtend, dus we zijn thuis gebleven en hebben de krant gelezen. Mijn
+        broer wil weten wanneer de volgende trein naar de stad vertrekt. Ik denk dat het
+        belangrijk is om tijd door te brengen met je familie en vrienden. Waar heb je de
+        sleutels gelegd? Ze zouden op de tafel in de keuken moeten liggen. We werken al heel
+        lang aan dit project en we zijn tevreden met de resultaten. Kunt u mij vertellen
+        hoeveel dit kost? De kinderen speelden in de tuin terwijl hun ouders het avondeten
+        klaarmaakten. Wat zou je dit weekend willen doen? Heel erg bedankt voor je hulp, en
+        nog een fijne dag.
+        De nieuwe versie van de applicatie is vorige week verschenen na een aantal maanden
+        testen. De meeste wijzigingen zijn klein, maar gebruikers zullen merken dat het
+        programma sneller opstart en minder geheugen gebruikt dan eerst. Als u vragen heeft
+        over de update, kunt u een bericht sturen naar ons supportteam, dat elk bericht
+        binnen twee werkdagen beantwoordt. Ook willen we iedereen bedanken die problemen heeft
+        gemeld en ons heeft geholpen om de oorzaak te vinden. Volgens het rapport is het
+        aantal bezoekers van het museum sinds de opening elk jaar gegroeid, en de gemeente
+        is nu van plan om een tweede ingang te bouwen. Niemand weet nog hoe lang het werk
+        gaat duren of hoeveel het gaat kosten, omdat het oude gebouw tijdens het hele
+        project open moet blijven.
+    """,
+    "Swedish": """
+        Det var kallt i morse, så vi stannade hemma och läste tidningen. Min bror vill veta
+        när nästa tåg går till staden. Jag tycker att det är viktigt att tillbringa tid med
+        sin familj och sina vänner. Var lade du nycklarna? De borde ligga på bordet i köket.
+        Vi har arbetat med det här projektet länge och vi är nöjda med resultatet. Kan du
+        säga mig hur mycket det här kostar? Barnen lekte i trädgården medan deras föräldrar
+        lagade middag. Vad skulle du vilja göra i helgen? Tack så mycket för din hjälp, och
+        ha en trevlig dag.
+        Den nya versionen av programmet släpptes förra veckan efter flera månaders tester. De
+        flesta ändringarna är små, men användarna kommer att märka att programmet startar
+        snabbare och använder mindre minne än tidigare. Om du har frågor om uppdateringen kan
+        du skriva till vårt supportteam, som svarar på alla meddelanden inom två arbetsdagar.
+        Vi vill också tacka alla som har rapporterat problem och hjälpt oss att hitta
+        orsakerna. Enligt rapporten har antalet besökare på museet ökat varje år sedan det
+        öppnade, och kommunen planerar nu att bygga en andra ingång. Ingen vet ännu hur länge
+        arbetet kommer att pågå eller hur mycket det kommer att kosta, eftersom den gamla
+        byggnaden måste vara öppen under hela projektet.
+    """,
+    "Polish": """
+        Dziś rano było zimno, więc zostaliśmy w domu i czytaliśmy gazetę. Mój brat chce
+        wiedzieć, kiedy odjeżdża następny pociąg do miasta. Myślę, że ważne jest, aby spędzać
+        czas z rodziną i przyjaciółmi. Gdzie położyłeś klucze? Powinny być na stole w kuchni.
+        Pracujemy nad tym projektem od dawna i jesteśmy zadowoleni z wyników. Czy mógłby pan
+        mi powiedzieć, ile to kosztuje? Dzieci bawiły się w ogrodzie, podczas gdy ich rodzice
+        przygotowywali obiad. Co chciałbyś robić w ten weekend? Bardzo dziękuję za pomoc i
+        miłego dnia.
+        Nowa wersja aplikacji została wydana w zeszłym tygodniu po kilku miesiącach testów.
+        Większość zmian jest niewielka, ale użytkownicy zauważą, że program uruchamia się
+        szybciej i zużywa mniej pamięci niż wcześniej. Jeśli mają państwo pytania dotyczące
+        aktualizacji, można napisać do naszego zespołu wsparcia, który odpowiada na każdą
+        wiadomość w ciągu dwóch dni roboczych. Chcemy również podziękować wszystkim, którzy
+        zgłosili problemy i pomogli nam znaleźć ich przyczyny. Według raportu liczba
+        odwiedzających muzeum rośnie każdego roku od jego otwarcia, a miasto planuje teraz
+        budowę drugiego wejścia. Nikt jeszcze nie wie, jak długo potrwają prace ani ile będą
+        kosztować, ponieważ stary budynek musi być otwarty przez cały czas trwania projektu.
+    """,
+    "Turkish": """
+        Bu sabah hava soğuktu, bu yüzden evde kaldık ve gazete okuduk. Kardeşim şehre giden
+        bir sonraki trenin ne zaman kalkacağını bilmek istiyor. Bence ailen ve arkadaşlarınla
+        vakit geçirmek çok önemli. Anahtarları nereye koydun? Mutfaktaki masanın üzerinde
+        olmalılar. Bu proje üzerinde uzun zamandır çalışıyoruz ve sonuçlardan memnunuz. Bunun
+        ne kadar olduğunu söyleyebilir misiniz? Çocuklar bahçede oynarken anne ve babaları
+        akşam yemeğini hazırlıyordu. Bu hafta sonu ne yapmak istersin? Yardımın için çok
+        teşekkür ederim, iyi günler.
+        Uygulamanın yeni sürümü birkaç aylık testin ardından geçen hafta yayınlandı.
+        Değişikliklerin çoğu küçük, ancak kullanıcılar programın daha hızlı açıldığını ve
+        eskisinden daha az bellek kullandığını fark edecekler. Güncelleme hakkında sorularınız
+        varsa, her mesaja iki iş günü içinde cevap veren destek ekibimize yazabilirsiniz.
+        Ayrıca sorunları bildiren ve nedenlerini bulmamıza yardım eden herkese teşekkür etmek
+        istiyoruz. Rapora göre müzenin ziyaretçi sayısı açıldığından beri her yıl arttı ve
+        belediye şimdi ikinci bir giriş yapmayı planlıyor. Çalışmaların ne kadar süreceğini
+        ya da ne kadara mal olacağını henüz kimse bilmiyor, çünkü eski binanın proje boyunca
+        açık kalması gerekiyor.
+    """,
+    "Indonesian": """
+        Pagi ini cuacanya dingin, jadi kami tinggal di rumah dan membaca koran. Saudara saya
+        ingin tahu kapan kereta berikutnya berangkat ke kota. Saya pikir penting untuk
+        menghabiskan waktu bersama keluarga dan teman-teman. Di mana kamu menaruh kuncinya?
+        Seharusnya ada di atas meja di dapur. Kami sudah lama mengerjakan proyek ini dan kami
+        senang dengan hasilnya. Bisakah Anda memberi tahu saya berapa harganya? Anak-anak
+        bermain di kebun sementara orang tua mereka menyiapkan makan malam. Apa yang ingin
+        kamu lakukan akhir pekan ini? Terima kasih banyak atas bantuanmu, dan semoga harimu
+        menyenangkan.
+        Versi baru aplikasi ini dirilis minggu lalu setelah beberapa bulan pengujian.
+        Sebagian besar perubahannya kecil, tetapi pengguna akan melihat bahwa program ini
+        berjalan lebih cepat dan memakai lebih sedikit memori daripada sebelumnya. Jika Anda
+        punya pertanyaan tentang pembaruan ini, Anda dapat menulis kepada tim dukungan kami,
+        yang menjawab setiap pesan dalam dua hari kerja. Kami juga ingin berterima kasih
+        kepada semua orang yang telah melaporkan masalah dan membantu kami menemukan
+        penyebabnya. Menurut laporan tersebut, jumlah pengunjung museum terus bertambah
+        setiap tahun sejak dibuka, dan pemerintah kota sekarang berencana membangun pintu
+        masuk kedua. Belum ada yang tahu berapa lama pekerjaan itu akan berlangsung atau
+        berapa biayanya, karena gedung yang lama harus tetap buka selama proyek berjalan.
+    """,
+    "Vietnamese": """
+        Sáng nay trời lạnh, vì vậy chúng tôi ở nhà và đọc báo. Anh trai tôi muốn biết khi nào
+        chuyến tàu tiếp theo đi vào thành phố. Tôi nghĩ rằng việc dành thời gian cho gia đình
+        và bạn bè là rất quan trọng. Bạn để chìa khóa ở đâu? Chúng phải ở trên bàn trong nhà
+        bếp. Chúng tôi đã làm dự án này trong một thời gian dài và chúng tôi hài lòng với kết
+        quả. Bạn có thể cho tôi biết cái này giá bao nhiêu không? Bọn trẻ chơi trong vườn
+        trong khi bố mẹ chúng chuẩn bị bữa tối. Cuối tuần này bạn muốn làm gì? Cảm ơn bạn rất
+        nhiều vì đã giúp đỡ, chúc bạn một ngày tốt lành.
+        Phiên bản mới của ứng dụng đã được phát hành vào tuần trước sau nhiều tháng thử
+        nghiệm. Phần lớn các thay đổi đều nhỏ, nhưng người dùng sẽ nhận thấy chương trình
+        khởi động nhanh hơn và dùng ít bộ nhớ hơn trước. Nếu bạn có câu hỏi về bản cập nhật,
+        bạn có thể viết cho nhóm hỗ trợ của chúng tôi, họ trả lời mọi tin nhắn trong vòng hai
+        ngày làm việc. Chúng tôi cũng muốn cảm ơn tất cả những người đã báo cáo lỗi và giúp
+        chúng tôi tìm ra nguyên nhân. Theo báo cáo, số lượng khách tham quan bảo tàng đã tăng
+        lên mỗi năm kể từ khi mở cửa, và thành phố hiện đang có kế hoạch xây dựng một lối vào
+        thứ hai.
+    """,
+    "Romanian": """
+        Azi-dimineață a fost frig, așa că am rămas acasă și am citit ziarul. Fratele meu
+        vrea să știe când pleacă următorul tren spre oraș. Cred că este important să petreci
+        timp cu familia și cu prietenii. Unde ai pus cheile? Ar trebui să fie pe masa din
+        bucătărie. Lucrăm de mult timp la acest proiect și suntem mulțumiți de rezultate.
+        Ați putea să-mi spuneți cât costă asta? Copiii se jucau în grădină în timp ce
+        părinții lor pregăteau cina. Ce ți-ar plăcea să faci în acest weekend? Mulțumesc
+        foarte mult pentru ajutor și o zi bună. Noua versiune a aplicației a fost lansată
+        săptămâna trecută, după câteva luni de teste. Majoritatea modificărilor sunt mici,
+        dar utilizatorii vor observa că programul pornește mai repede și folosește mai
+        puțină memorie decât înainte. Dacă aveți întrebări despre actualizare, puteți scrie
+        echipei noastre de asistență, care răspunde la fiecare mesaj în două zile lucrătoare.
+        Potrivit raportului, numărul vizitatorilor muzeului a crescut în fiecare an de la
+        deschidere, iar primăria plănuiește acum să construiască o a doua intrare.
+    """,
+    "Finnish": """
+        Tänä aamuna oli kylmä, joten jäimme kotiin ja luimme sanomalehteä. Veljeni haluaa
+        tietää, milloin seuraava juna lähtee kaupunkiin. Minusta on tärkeää viettää aikaa
+        perheen ja ystävien kanssa. Mihin laitoit avaimet? Niiden pitäisi olla keittiön
+        pöydällä. Olemme tehneet tätä projektia pitkään ja olemme tyytyväisiä tuloksiin.
+        Voisitteko kertoa, paljonko tämä maksaa? Lapset leikkivät puutarhassa, kun heidän
+        vanhempansa valmistivat illallista. Mitä haluaisit tehdä tänä viikonloppuna? Kiitos
+        paljon avustasi ja hyvää päivänjatkoa. Sovelluksen uusi versio julkaistiin viime
+        viikolla useiden kuukausien testauksen jälkeen. Useimmat muutokset ovat pieniä, mutta
+        käyttäjät huomaavat, että ohjelma käynnistyy nopeammin ja käyttää vähemmän muistia
+        kuin ennen. Jos sinulla on kysyttävää päivityksestä, voit kirjoittaa tukitiimillemme,
+        joka vastaa jokaiseen viestiin kahden työpäivän kuluessa. Raportin mukaan museon
+        kävijöiden määrä on kasvanut joka vuosi sen avaamisesta lähtien, ja kaupunki
+        suunnittelee nyt toisen sisäänkäynnin rakentamista.
+    """,
+    "Czech": """
+        Dnes ráno byla zima, a tak jsme zůstali doma a četli noviny. Můj bratr chce vědět,
+        kdy jede další vlak do města. Myslím si, že je důležité trávit čas s rodinou a
+        přáteli. Kam jsi dal klíče? Měly by být na stole v kuchyni. Na tomto projektu
+        pracujeme už dlouho a jsme s výsledky spokojeni. Mohl byste mi říct, kolik to stojí?
+        Děti si hrály na zahradě, zatímco jejich rodiče připravovali večeři. Co bys chtěl
+        dělat o víkendu? Moc děkuji za pomoc a přeji hezký den. Nová verze aplikace vyšla
+        minulý týden po několika měsících testování. Většina změn je malá, ale uživatelé si
+        všimnou, že se program spouští rychleji a používá méně paměti než dříve. Pokud máte
+        otázky k aktualizaci, můžete napsat našemu týmu podpory, který odpovídá na každou
+        zprávu do dvou pracovních dnů. Podle zprávy počet návštěvníků muzea od jeho otevření
+        každý rok roste a město nyní plánuje postavit druhý vchod.
+    """,
+    "Hungarian": """
+        Ma reggel hideg volt, ezért otthon maradtunk és újságot olvastunk. A bátyám tudni
+        szeretné, mikor indul a következő vonat a városba. Szerintem fontos, hogy időt
+        töltsünk a családdal és a barátainkkal. Hová tetted a kulcsokat? Az asztalon kellene
+        lenniük a konyhában. Régóta dolgozunk ezen a projekten, és elégedettek vagyunk az
+        eredményekkel. Meg tudná mondani, mennyibe kerül ez? A gyerekek a kertben játszottak,
+        miközben a szüleik a vacsorát készítették. Mit szeretnél csinálni a hétvégén? Nagyon
+        köszönöm a segítséget, és legyen szép napod. Az alkalmazás új verziója a múlt héten
+        jelent meg, több hónapos tesztelés után. A legtöbb változás kicsi, de a felhasználók
+        észre fogják venni, hogy a program gyorsabban indul és kevesebb memóriát használ,
+        mint korábban. Ha kérdése van a frissítéssel kapcsolatban, írhat a támogatási
+        csapatunknak, amely minden üzenetre két munkanapon belül válaszol. A jelentés szerint
+        a múzeum látogatóinak száma a megnyitása óta minden évben nőtt.
+    """,
+}
+
+# Languages that can be recognised from their writing system alone. Each entry
+# is (language, inclusive code point ranges).
+SCRIPT_LANGUAGES = [
+    ("Japanese", [(0x3040, 0x309F), (0x30A0, 0x30FF)]),
+    ("Korean", [(0xAC00, 0xD7AF), (0x1100, 0x11FF)]),
+    ("Chinese", [(0x4E00, 0x9FFF), (0x3400, 0x4DBF)]),
+    ("Russian", [(0x0400, 0x04FF)]),
+    ("Greek", [(0x0370, 0x03FF)]),
+    ("Arabic", [(0x0600, 0x06FF)]),
+    ("Hebrew", [(0x0590, 0x05FF)]),
+    ("Hindi", [(0x0900, 0x097F)]),
+    ("Thai", [(0x0E00, 0x0E7F)]),
+]
+
+# Letters that single out a language within a shared script
+SCRIPT_VARIANTS = {
+    "Russian": ("Ukrainian", set("іїєґІЇЄҐ")),
+    "Arabic": ("Persian", set("پچژگ")),
+}
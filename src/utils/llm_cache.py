@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import AsyncIterator, Dict, Iterable, Iterator, Optional
+
+
+class CachedGeneration:
+    """Minimal stand-in for a Cohere generation served from the cache"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class CachedResponse:
+    """Minimal stand-in for a Cohere generate response served from the cache"""
+
+    def __init__(self, text: str):
+        self.generations = [CachedGeneration(text)]
+        self.cached = True
+
+
+class ResponseCache:
+    """On-disk LRU cache of LLM responses backed by SQLite"""
+
+    def __init__(self, path: str, max_entries: int = 1000, ttl: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        # Create the cache directory if it doesn't exist
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        # A single connection is shared between threads, guarded by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(prompt: str, max_tokens=None, temperature=None, model=None, **extra) -> str:
+        """Build a stable cache key from the request parameters"""
+        payload = json.dumps({
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "model": model,
+            "extra": extra,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for a key, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            text, created_at = row
+            if self.ttl and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            # Touch the entry so it moves to the back of the eviction order
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return text
+
+    def set(self, key: str, text: str):
+        """Store a response and evict the least recently used entries over the limit"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, text, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, text, now, now)
+            )
+            if self.max_entries:
+                self._conn.execute(
+                    """DELETE FROM responses WHERE key IN (
+                        SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )""",
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every cached response and reset the counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and the current number of entries"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def stream_event_text(event) -> Optional[str]:
+    """Extract the generated text from a Cohere streaming event, if it carries any"""
+    if getattr(event, "event_type", "text-generation") != "text-generation":
+        return None
+    return getattr(event, "text", None)
+
+
+class CachedClient:
+    """Wraps a Cohere client so identical generate calls are served from a ResponseCache"""
+
+    def __init__(self, client, cache: Optional[ResponseCache] = None, model: Optional[str] = None,
+                 disabled_agents: Iterable[str] = ()):
+        self.client = client
+        self.cache = cache
+        self.model = model
+        self.disabled_agents = set(disabled_agents)
+
+    def cache_enabled_for(self, agent: Optional[str]) -> bool:
+        """Check whether responses for the given agent may be cached"""
+        return self.cache is not None and agent not in self.disabled_agents
+
+    def _prepare(self, prompt, max_tokens, temperature, agent, use_cache, kwargs):
+        """Build the API request and the cache key (None when caching is off)"""
+        model = kwargs.pop("model", None) or self.model
+
+        request = {"prompt": prompt}
+        if max_tokens is not None:
+            request["max_tokens"] = max_tokens
+        if temperature is not None:
+            request["temperature"] = temperature
+        if model:
+            request["model"] = model
+        request.update(kwargs)
+
+        if not use_cache or not self.cache_enabled_for(agent):
+            return request, None
+
+        return request, ResponseCache.make_key(prompt, max_tokens, temperature, model, **kwargs)
+
+    def generate(self, prompt: str, max_tokens=None, temperature=None, agent: Optional[str] = None,
+                 use_cache: bool = True, **kwargs):
+        """Drop-in replacement for cohere.Client.generate with response caching"""
+        request, key = self._prepare(prompt, max_tokens, temperature, agent, use_cache, kwargs)
+        if key is None:
+            return self.client.generate(**request)
+
+        text = self.cache.get(key)
+        if text is not None:
+            return CachedResponse(text)
+
+        response = self.client.generate(**request)
+        self.cache.set(key, response.generations[0].text)
+        return response
+
+    def generate_stream(self, prompt: str, max_tokens=None, temperature=None, agent: Optional[str] = None,
+                        use_cache: bool = True, **kwargs) -> Iterator[str]:
+        """Stream generated text chunk by chunk, sharing cache entries with generate"""
+        request, key = self._prepare(prompt, max_tokens, temperature, agent, use_cache, kwargs)
+        if key is not None:
+            text = self.cache.get(key)
+            if text is not None:
+                yield text
+                return
+
+        chunks = []
+        for event in self.client.generate_stream(**request):
+            chunk = stream_event_text(event)
+            if chunk:
+                chunks.append(chunk)
+                yield chunk
+
+        if key is not None:
+            self.cache.set(key, "".join(chunks))
+
+    def __getattr__(self, name):
+        # Anything other than generate goes straight to the wrapped client
+        return getattr(self.client, name)
+
+
+class AsyncCachedClient(CachedClient):
+    """Async counterpart of CachedClient for cohere.AsyncClient, sharing the same cache"""
+
+    async def generate(self, prompt: str, max_tokens=None, temperature=None, agent: Optional[str] = None,
+                       use_cache: bool = True, **kwargs):
+        """Drop-in replacement for cohere.AsyncClient.generate with response caching"""
+        request, key = self._prepare(prompt, max_tokens, temperature, agent, use_cache, kwargs)
+        if key is None:
+            return await self.client.generate(**request)
+
+        text = self.cache.get(key)
+        if text is not None:
+            return CachedResponse(text)
+
+        response = await self.client.generate(**request)
+        self.cache.set(key, response.generations[0].text)
+        return response
+
+    async def generate_stream(self, prompt: str, max_tokens=None, temperature=None, agent: Optional[str] = None,
+                              use_cache: bool = True, **kwargs) -> AsyncIterator[str]:
+        """Async counterpart of CachedClient.generate_stream"""
+        request, key = self._prepare(prompt, max_tokens, temperature, agent, use_cache, kwargs)
+        if key is not None:
+            text = self.cache.get(key)
+            if text is not None:
+                yield text
+                return
+
+        chunks = []
+        async for event in self.client.generate_stream(**request):
+            chunk = stream_event_text(event)
+            if chunk:
+                chunks.append(chunk)
+                yield chunk
+
+        if key is not None:
+            self.cache.set(key, "".join(chunks))
@@ -0,0 +1,57 @@
+import ast
+import hashlib
+import textwrap
+from typing import List, Optional, Tuple
+
+# Sources shorter than this are explained as a single unit
+MIN_SPLIT_LINES = 40
+
+
+def split_python_source(source: str, min_lines: int = MIN_SPLIT_LINES) -> List[Tuple[Optional[str], str]]:
+    """Split a Python module into its top-level functions and classes
+
+    Returns (label, source) pairs in file order. Imports and other module-level
+    statements are grouped into one leading unit. Sources that are short, not
+    valid Python, or contain fewer than two definitions come back unsplit with
+    a label of None.
+    """
+    if source.count("\n") + 1 < min_lines:
+        return [(None, source)]
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return [(None, source)]
+
+    lines = source.splitlines()
+    units, module_lines = [], []
+
+    for node in tree.body:
+        # Decorators belong to the definition they decorate
+        start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+        segment = lines[start - 1:node.end_lineno]
+
+        if isinstance(node, ast.ClassDef):
+            units.append((f"class {node.name}", "\n".join(segment)))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            units.append((f"function {node.name}", "\n".join(segment)))
+        else:
+            module_lines.extend(segment)
+
+    if len(units) < 2:
+        return [(None, source)]
+
+    if module_lines:
+        units.insert(0, ("module-level code", "\n".join(module_lines)))
+
+    return units
+
+
+def normalized_source_hash(source: str) -> str:
+    """Hash source code so formatting and comment changes don't change the key"""
+    try:
+        normalized = ast.dump(ast.parse(textwrap.dedent(source)))
+    except SyntaxError:
+        # Not Python, so only ignore surrounding and trailing whitespace
+        normalized = "\n".join(line.rstrip() for line in source.strip().splitlines())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,116 @@
+import re
+from typing import List, Tuple
+
+# Rough number of characters per token for English text
+CHARS_PER_TOKEN = 4
+
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+# Chinese and Japanese end sentences with full-width marks and no space
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+|(?<=[。！？])\s*')
+
+# Chinese, Japanese and Korean characters and full-width punctuation, about a token each
+_WIDE_CHARS = re.compile(r'[\u1100-\u11ff\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]')
+
+
+def _token_count(wide: int, narrow: int) -> int:
+    return wide + (narrow + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for budgeting prompts"""
+    wide = len(_WIDE_CHARS.findall(text))
+    return _token_count(wide, len(text) - wide)
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Split text on blank lines, dropping empty paragraphs"""
+    return [p.strip() for p in _PARAGRAPH_BREAK.split(text) if p.strip()]
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text after sentence-ending punctuation"""
+    return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+
+
+def _sentences_with_separators(text: str) -> List[Tuple[str, str]]:
+    # Like split_sentences, but keeps whether a space followed the sentence before
+    sentences, start, separator = [], 0, ""
+    for match in _SENTENCE_END.finditer(text):
+        sentence = text[start:match.start()].strip()
+        if sentence:
+            sentences.append((sentence, separator))
+        start, separator = match.end(), " " if match.group() else ""
+    if text[start:].strip():
+        sentences.append((text[start:].strip(), separator))
+    return sentences
+
+
+def _split_chars(word: str, max_tokens: int) -> List[str]:
+    # Scripts written without spaces reach this as one long "word"
+    pieces, start, wide, narrow = [], 0, 0, 0
+    for i, char in enumerate(word):
+        is_wide = _WIDE_CHARS.match(char) is not None
+        wide, narrow = wide + is_wide, narrow + (not is_wide)
+        if i > start and _token_count(wide, narrow) > max_tokens:
+            pieces.append(word[start:i])
+            start, wide, narrow = i, int(is_wide), int(not is_wide)
+    pieces.append(word[start:])
+    return pieces
+
+
+def _split_words(text: str, max_tokens: int) -> List[Tuple[str, str]]:
+    # Last resort for a single sentence that is over budget on its own. Returns
+    # (piece, separator before it); pieces cut out of one word follow on with ""
+    pieces, current, separator, wide, narrow = [], [], " ", 0, 0
+    for word in text.split():
+        parts = _split_chars(word, max_tokens) if estimate_tokens(word) > max_tokens else [word]
+        for i, part in enumerate(parts):
+            part_wide = len(_WIDE_CHARS.findall(part))
+            part_narrow = len(part) - part_wide
+            if current and (i > 0 or _token_count(wide + part_wide, narrow + 1 + part_narrow) > max_tokens):
+                pieces.append((" ".join(current), separator))
+                current, wide, narrow = [], 0, 0
+            if not current:
+                separator = "" if i > 0 else " "
+            wide += part_wide
+            narrow += part_narrow + (1 if current else 0)
+            current.append(part)
+    if current:
+        pieces.append((" ".join(current), separator))
+    return pieces
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """Pack text into chunks of at most max_tokens
+
+    Chunks break on paragraph boundaries where possible, then on sentence
+    boundaries, and only split inside a sentence when it is over budget alone.
+    """
+    units = []
+    for paragraph in split_paragraphs(text):
+        if estimate_tokens(paragraph) <= max_tokens:
+            units.append((paragraph, "\n\n"))
+            continue
+        pieces = []
+        for sentence, separator in _sentences_with_separators(paragraph):
+            if estimate_tokens(sentence) <= max_tokens:
+                pieces.append((sentence, separator))
+            else:
+                split = _split_words(sentence, max_tokens)
+                pieces.append((split[0][0], separator))
+                pieces.extend(split[1:])
+        # Only the first piece of a paragraph starts on a new paragraph
+        units.extend((piece, "\n\n" if i == 0 else separator) for i, (piece, separator) in enumerate(pieces))
+
+    chunks, current, current_tokens = [], "", 0
+    for unit, separator in units:
+        unit_tokens = estimate_tokens(unit)
+        if current and current_tokens + unit_tokens + 1 > max_tokens:
+            chunks.append(current)
+            current, current_tokens = "", 0
+        current = f"{current}{separator}{unit}" if current else unit
+        current_tokens = estimate_tokens(current)
+    if current:
+        chunks.append(current)
+
+    return chunks
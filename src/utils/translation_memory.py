@@ -0,0 +1,245 @@
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Dict, Optional, Set
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Maximum number of fuzzy candidates scored per lookup
+FUZZY_CANDIDATES = 50
+
+
+def normalize_segment(text: str) -> str:
+    """Normalize a segment for exact matching"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def segment_trigrams(normalized: str) -> Set[str]:
+    """Character trigrams used by the fuzzy index"""
+    padded = f"  {normalized.lower()}  "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TranslationMemory:
+    """Local SQLite store of past translations with exact and fuzzy lookup
+
+    Writes share one connection guarded by a lock. Lookups use a read
+    connection per thread, so concurrent document segments don't queue
+    behind each other.
+    """
+
+    def __init__(self, path: str, fuzzy_threshold: float = 0.9):
+        self.path = path
+        self.fuzzy_threshold = fuzzy_threshold
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+
+        # Create the memory directory if it doesn't exist
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS segments (
+                    id INTEGER PRIMARY KEY,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    normalized TEXT NOT NULL,
+                    translation TEXT NOT NULL,
+                    gram_count INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    UNIQUE (source_lang, target_lang, normalized)
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS segment_grams (
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    gram TEXT NOT NULL,
+                    segment_id INTEGER NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS gram_frequencies (
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    gram TEXT NOT NULL,
+                    segments INTEGER NOT NULL,
+                    PRIMARY KEY (source_lang, target_lang, gram)
+                )"""
+            )
+            self._migrate()
+            self._conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_segment_grams_length
+                ON segment_grams (source_lang, target_lang, gram, gram_count, segment_id)"""
+            )
+            self._conn.commit()
+
+    def _migrate(self):
+        # Memories written before the length filter lack the per-posting gram counts and frequencies
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(segment_grams)")]
+        if "gram_count" in columns:
+            return
+        self._conn.execute("ALTER TABLE segment_grams ADD COLUMN gram_count INTEGER")
+        self._conn.execute(
+            "UPDATE segment_grams SET gram_count = (SELECT gram_count FROM segments WHERE id = segment_id)"
+        )
+        self._conn.execute(
+            """INSERT OR REPLACE INTO gram_frequencies (source_lang, target_lang, gram, segments)
+            SELECT source_lang, target_lang, gram, COUNT(*) FROM segment_grams
+            GROUP BY source_lang, target_lang, gram"""
+        )
+        self._conn.execute("DROP INDEX IF EXISTS idx_segment_grams")
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path)
+        return conn
+
+    @staticmethod
+    def _pair(source_lang: str, target_lang: str, kind: Optional[str] = None):
+        # Other kinds of output (e.g. annotated answers) are kept apart from bare translations
+        target_lang = target_lang.strip().lower()
+        if kind:
+            target_lang = f"{target_lang}#{kind}"
+        return source_lang.strip().lower(), target_lang
+
+    def lookup(self, source_lang: str, target_lang: str, text: str, kind: Optional[str] = None) -> Optional[Dict]:
+        """Find a stored translation for a segment
+
+        Returns a dict with the translation, the stored source text, the match
+        score (1.0 for exact matches) and whether the match was fuzzy, or None
+        when nothing is similar enough. Segments that differ only in case or
+        whitespace count as exact; a fuzzy match belongs to another sentence
+        and is only fit to be used as a reference.
+        """
+        source_lang, target_lang = self._pair(source_lang, target_lang, kind)
+        normalized = normalize_segment(text)
+        conn = self._reader()
+
+        row = conn.execute(
+            "SELECT translation FROM segments WHERE source_lang = ? AND target_lang = ? AND normalized = ?",
+            (source_lang, target_lang, normalized)
+        ).fetchone()
+        if row:
+            match = {"translation": row[0], "source": normalized, "score": 1.0, "fuzzy": False}
+        else:
+            match = self._fuzzy_lookup(conn, source_lang, target_lang, normalized)
+            if match and match["source"].casefold() == normalized.casefold():
+                match = {**match, "score": 1.0, "fuzzy": False}
+
+        with self._lock:
+            if match is None:
+                self.misses += 1
+            elif match["fuzzy"]:
+                self.fuzzy_hits += 1
+            else:
+                self.exact_hits += 1
+        return match
+
+    def _fuzzy_lookup(self, conn: sqlite3.Connection, source_lang: str, target_lang: str,
+                      normalized: str) -> Optional[Dict]:
+        grams = segment_trigrams(normalized)
+        threshold = self.fuzzy_threshold
+        if not grams or not threshold or threshold > 1:
+            return None
+
+        # A Dice score of at least the threshold bounds the size of the other
+        # trigram set, and the number of trigrams both must share (the epsilon
+        # keeps rounding errors from excluding a segment right at the threshold)
+        size = len(grams)
+        min_count = math.ceil(size * threshold / (2 - threshold) - 1e-9)
+        max_count = math.floor(size * (2 - threshold) / threshold + 1e-9)
+        min_shared = math.ceil(threshold * (size + min_count) / 2 - 1e-9)
+
+        # Any such segment contains at least one of the size - min_shared + 1
+        # rarest query trigrams, so common ones like " th" are never probed
+        placeholders = ",".join("?" * len(grams))
+        frequencies = dict(conn.execute(
+            f"""SELECT gram, segments FROM gram_frequencies
+                WHERE source_lang = ? AND target_lang = ? AND gram IN ({placeholders})""",
+            (source_lang, target_lang, *grams)
+        ).fetchall())
+        probe = sorted(grams, key=lambda gram: frequencies.get(gram, 0))[:size - min_shared + 1]
+        probe = [gram for gram in probe if gram in frequencies]
+        if not probe:
+            return None
+
+        placeholders = ",".join("?" * len(probe))
+        rows = conn.execute(
+            f"""SELECT s.translation, s.normalized
+                FROM segments s JOIN (
+                    SELECT segment_id, COUNT(*) AS shared FROM segment_grams
+                    WHERE source_lang = ? AND target_lang = ? AND gram IN ({placeholders})
+                        AND gram_count BETWEEN ? AND ?
+                    GROUP BY segment_id
+                    ORDER BY shared DESC
+                    LIMIT ?
+                ) c ON s.id = c.segment_id""",
+            (source_lang, target_lang, *probe, min_count, max_count, FUZZY_CANDIDATES)
+        ).fetchall()
+
+        best = None
+        for translation, source in rows:
+            # Dice coefficient over the two trigram sets
+            other = segment_trigrams(source)
+            score = 2 * len(grams & other) / (size + len(other))
+            if score >= threshold and (best is None or score > best["score"]):
+                best = {"translation": translation, "source": source, "score": score, "fuzzy": True}
+        return best
+
+    def add(self, source_lang: str, target_lang: str, text: str, translation: str, kind: Optional[str] = None):
+        """Store a translation, replacing any previous one for the same segment and kind"""
+        source_lang, target_lang = self._pair(source_lang, target_lang, kind)
+        normalized = normalize_segment(text)
+        grams = segment_trigrams(normalized)
+
+        with self._lock:
+            existing = self._conn.execute(
+                "SELECT id FROM segments WHERE source_lang = ? AND target_lang = ? AND normalized = ?",
+                (source_lang, target_lang, normalized)
+            ).fetchone()
+            if existing:
+                self._conn.execute(
+                    "UPDATE segments SET translation = ?, created_at = ? WHERE id = ?",
+                    (translation, time.time(), existing[0])
+                )
+            else:
+                cursor = self._conn.execute(
+                    """INSERT INTO segments (source_lang, target_lang, normalized, translation, gram_count, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)""",
+                    (source_lang, target_lang, normalized, translation, len(grams), time.time())
+                )
+                self._conn.executemany(
+                    """INSERT INTO segment_grams (source_lang, target_lang, gram, segment_id, gram_count)
+                    VALUES (?, ?, ?, ?, ?)""",
+                    [(source_lang, target_lang, gram, cursor.lastrowid, len(grams)) for gram in grams]
+                )
+                self._conn.executemany(
+                    """INSERT INTO gram_frequencies (source_lang, target_lang, gram, segments) VALUES (?, ?, ?, 1)
+                    ON CONFLICT (source_lang, target_lang, gram) DO UPDATE SET segments = segments + 1""",
+                    [(source_lang, target_lang, gram) for gram in grams]
+                )
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Return lookup counters and the number of stored segments"""
+        with self._lock:
+            segments = self._conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        return {
+            "exact_hits": self.exact_hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+            "segments": segments,
+        }